@@ -1,6 +1,9 @@
 """Tests for IIS/Conflict Refiner parsing in veda_run_times."""
 
-from tools.veda_run_times.runner import parse_gams_listing
+import re
+
+from tools.veda_run_times import runner
+from tools.veda_run_times.runner import parse_gams_listing, parse_lst_file
 
 
 def test_iis_parsing_with_conflict_section():
@@ -74,3 +77,243 @@ indic: EQ_IND$b 0
     assert "lower" in roles
     assert "sos" in roles
     assert "indic" in roles
+
+
+def test_parse_lst_file_maps_listing(tmp_path):
+    """Test that parse_lst_file parses the listing via a memory map."""
+    lst = tmp_path / "scenario.lst"
+    lst.write_bytes(
+        b"**** ERROR 140 Unknown symbol\n"
+        b"**** MODEL STATUS      4 INFEASIBLE\n"
+        b"**** SOLVER STATUS     1 NORMAL COMPLETION\n"
+        b"\n"
+        b"Conflict Refiner status\n"
+        b"Number of equations in conflict:   1\n"
+        b"\n"
+        b"upper: EQ_DEMAND(\xff) < 100\n"
+    )
+    result = parse_lst_file(lst)
+
+    assert result["model_status"] == "INFEASIBLE"
+    assert result["solve_status"] == "NORMAL COMPLETION"
+    assert result["errors"] == ["ERROR 140 Unknown symbol"]
+    members = result["diagnostics"]["iis"]["members"]
+    assert members[0]["symbol"] == "EQ_DEMAND(\ufffd)"
+
+
+def test_parse_lst_file_uppercases_mapped_listing_in_chunks(tmp_path, monkeypatch):
+    """Test that a mapped listing parses the same as its bytes, chunk by chunk."""
+    monkeypatch.setattr(runner, "LISTING_CHUNK_SIZE", 16)
+    listing = (
+        b"   1  SET  R regions / NORTH, SOUTH /;\n" * 20
+        + b"Problem is Unbounded\n"
+        + b"**** MODEL STATUS      1 OPTIMAL\n"
+    )
+    lst = tmp_path / "scenario.lst"
+    lst.write_bytes(listing)
+    result = parse_lst_file(lst)
+
+    assert result["diagnostics"] == parse_gams_listing(listing)
+    assert result["diagnostics"]["flags"]["unbounded"] is True
+
+
+def test_parse_lst_file_empty_listing(tmp_path):
+    """Test that an empty listing file parses without a solver status."""
+    lst = tmp_path / "scenario.lst"
+    lst.write_bytes(b"")
+    result = parse_lst_file(lst)
+
+    assert result["model_status"] is None
+    assert result["diagnostics"]["execution"]["ran_solver"] is False
+
+
+def test_solve_summary_found_after_large_preamble():
+    """Test that status lines are parsed when preceded by a long listing."""
+    content = (
+        "Compilation output line\n" * 10000
+        + "**** SOLVER STATUS     1 NORMAL COMPLETION\n"
+        + "**** MODEL STATUS      1 OPTIMAL\n"
+        + "**** OBJECTIVE VALUE   42.5\n"
+    )
+    diag = parse_gams_listing(content)
+
+    assert diag["execution"]["model_status"]["code"] == 1
+    assert diag["execution"]["solve_status"]["category"] == "ok"
+    assert diag["execution"]["objective"]["value"] == 42.5
+
+
+TWO_SOLVE_LISTING = (
+    b"Compilation output line\n" * 200
+    + b"               S O L V E      S U M M A R Y\n"
+    + b"     SOLVER   CPLEX\n"
+    + b"**** SOLVER STATUS     1 NORMAL COMPLETION\n"
+    + b"**** MODEL STATUS      1 OPTIMAL\n"
+    + b"**** OBJECTIVE VALUE   42.5\n"
+    + b"Report output line\n" * 400
+    + b"               S O L V E      S U M M A R Y\n"
+    + b"     SOLVER   CBC\n"
+    + b"**** SOLVER STATUS     1 NORMAL COMPLETION\n"
+    + b"**** MODEL STATUS      4 INFEASIBLE\n"
+    + b"**** OBJECTIVE VALUE   0.0\n"
+    + b"Report output line\n" * 200
+)
+
+
+def test_multiple_solves_report_first_solve_summary():
+    """Test that a listing with several solves reports the first summary."""
+    diag = parse_gams_listing(TWO_SOLVE_LISTING)
+
+    assert diag["execution"]["model_status"]["code"] == 1
+    assert diag["execution"]["objective"]["value"] == 42.5
+    assert diag["execution"]["solver"] == "CPLEX"
+
+
+def test_streamed_multiple_solves_report_first_solve_summary(tmp_path, monkeypatch):
+    """Test that streamed listings keep the first solve summary as well."""
+    monkeypatch.setattr(runner, "LISTING_STREAM_THRESHOLD", 1024)
+    monkeypatch.setattr(runner, "LISTING_CHUNK_SIZE", 64)
+    lst = tmp_path / "scenario.lst"
+    lst.write_bytes(TWO_SOLVE_LISTING)
+    result = parse_lst_file(lst)
+
+    assert result["model_status"] == "OPTIMAL"
+    assert result["objective"] == 42.5
+    assert result["diagnostics"]["execution"]["solver"] == "CPLEX"
+
+
+def test_flags_ignore_zero_summary_lines():
+    """Test flag scans, skipping "0 INFEASIBLE"-style report summary lines."""
+    diag = parse_gams_listing(
+        "*** Syntax error in line 12\n"
+        "                             0 INFEASIBLE\n"
+        "                             0 UNBOUNDED\n"
+        "Problem is unbounded\n"
+    )
+
+    assert diag["flags"]["syntax_error"] is True
+    assert diag["flags"]["infeasible"] is False
+    assert diag["flags"]["unbounded"] is True
+    assert diag["flags"]["licensing_problem"] is False
+    assert diag["summary"]["problem_type"] == "syntax_error"
+
+
+def test_integer_infeasible_also_flags_infeasible():
+    """Test that an integer infeasibility raises both infeasibility flags."""
+    diag = parse_gams_listing("**** Problem is integer infeasible\n")
+
+    assert diag["flags"]["integer_infeasible"] is True
+    assert diag["flags"]["infeasible"] is True
+
+
+def test_parse_lst_file_streams_large_listing(tmp_path, monkeypatch):
+    """Test that streamed listings keep the chunks the parser needs."""
+    monkeypatch.setattr(runner, "LISTING_STREAM_THRESHOLD", 1024)
+    monkeypatch.setattr(runner, "LISTING_CHUNK_SIZE", 256)
+    filler = b"   1  SET  R regions / NORTH, SOUTH /;\n" * 50
+    lst = tmp_path / "scenario.lst"
+    lst.write_bytes(
+        # Header sentinels that must not settle the licensing/unknown flags
+        b"Licensee: Example Org                         G230101/0001AB-GEN\n"
+        + b"Unknown option ignored\n"
+        + filler
+        + b"**** ERROR 140 Unknown symbol\n"
+        + filler
+        + b"LICENSE LIMIT exceeded\n"
+        + filler
+        + b"**** SOLVER STATUS     1 NORMAL COMPLETION\n"
+        + b"**** MODEL STATUS      1 OPTIMAL\n"
+        + b"**** OBJECTIVE VALUE   7.0\n"
+        + filler
+    )
+    result = parse_lst_file(lst)
+    diag = result["diagnostics"]
+
+    assert result["errors"] == ["ERROR 140 Unknown symbol"]
+    assert result["model_status"] == "OPTIMAL"
+    assert result["objective"] == 7.0
+    assert diag["flags"]["licensing_problem"] is True
+    assert diag["flags"]["unknown_symbol"] is True
+
+
+class _CountingPattern:
+    """Wrap a compiled pattern and count search calls."""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.calls = 0
+
+    def search(self, *args):
+        self.calls += 1
+        return self.pattern.search(*args)
+
+    def match(self, *args):
+        self.calls += 1
+        return self.pattern.match(*args)
+
+
+def test_compilation_failure_skips_solve_summary_scans(monkeypatch):
+    """Test that a failed compilation does not run the status regexes."""
+    counters = {}
+    for name in (
+        "MODEL_STATUS_RE",
+        "SOLVER_STATUS_RE",
+        "OBJECTIVE_VALUE_RE",
+        "OBJECTIVE_NAME_RE",
+        "SOLVER_NAME_RE",
+    ):
+        counters[name] = _CountingPattern(getattr(runner, name))
+        monkeypatch.setattr(runner, name, counters[name])
+
+    diag = parse_gams_listing(
+        "   1  OBJECTIVE objZ MINIMIZE\n**** ERROR 140 Unknown symbol\n"
+    )
+
+    assert diag["summary"]["problem_type"] == "compilation_error"
+    assert diag["execution"]["ran_solver"] is False
+    assert all(counter.calls == 0 for counter in counters.values())
+
+
+def test_objective_name_requires_trailing_whitespace():
+    """Test objective name/sense parsing, matching the whole-listing regex."""
+    summary = "**** MODEL STATUS      1 OPTIMAL\n"
+
+    diag = parse_gams_listing(summary + "     OBJECTIVE objZ MINIMIZE\n")
+    assert diag["execution"]["objective"]["name"] == "objZ"
+    assert diag["execution"]["objective"]["sense"] == "MINIMIZE"
+
+    # A name ending its line has no sense; one ending the listing is no match
+    diag = parse_gams_listing(summary + "     OBJECTIVE objZ\n")
+    assert diag["execution"]["objective"]["name"] == "objZ"
+    assert diag["execution"]["objective"]["sense"] is None
+    diag = parse_gams_listing(summary + "     OBJECTIVE objZ")
+    assert diag["execution"]["objective"]["name"] is None
+
+
+def test_diagnostics_to_dict_matches_asdict():
+    """Test that the field-by-field to_dict matches dataclasses.asdict."""
+    from dataclasses import asdict
+
+    diag = runner.parse_gams_diagnostics(
+        b"**** ERROR 140 Unknown symbol\n"
+        b"**** SOLVER STATUS     1 NORMAL COMPLETION\n"
+        b"**** MODEL STATUS      4 INFEASIBLE\n"
+        b"**** OBJECTIVE VALUE   7.0\n"
+        b"\n"
+        b"Conflict Refiner status\n"
+        b"Number of equations in conflict:   1\n"
+        b"\n"
+        b"upper: EQ_DEMAND(NORTH) < 100\n"
+    )
+    as_dict = diag.to_dict()
+
+    assert as_dict == asdict(diag)
+    assert repr(as_dict) == repr(asdict(diag))  # Same key order throughout
+
+
+def test_listing_patterns_are_precompiled():
+    """Test that every module-level *_RE name is a compiled pattern."""
+    names = [name for name in vars(runner) if name.endswith("_RE")]
+
+    assert names
+    for name in names:
+        assert isinstance(getattr(runner, name), re.Pattern), name
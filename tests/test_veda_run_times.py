@@ -0,0 +1,47 @@
+"""Tests for veda_run_times orchestration helpers."""
+
+from tools.veda_run_times import run_times_batch
+from tools.veda_run_times.runner import (
+    get_scaffold_dir,
+    reset_path_cache,
+    setup_work_dir,
+)
+
+
+def test_run_times_batch_preserves_job_order(tmp_path, monkeypatch):
+    """Batch runs should return one result per job, in job order."""
+    monkeypatch.delenv("TIMES_SRC", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    reset_path_cache()
+    try:
+        results = run_times_batch(
+            [
+                {"dd_dir": tmp_path, "case": "first"},
+                {"dd_dir": tmp_path, "case": "second"},
+            ],
+            max_workers=2,
+        )
+    finally:
+        reset_path_cache()
+
+    assert [r.case for r in results] == ["first", "second"]
+    # Without a TIMES source each run fails before invoking GAMS
+    assert all(not r.success and r.return_code == -1 for r in results)
+
+
+def test_setup_work_dir_copies_inputs_unless_linking(tmp_path):
+    """Kept work dirs get private copies; throwaway ones may link inputs."""
+    dd_dir = tmp_path / "dd"
+    dd_dir.mkdir()
+    source = dd_dir / "base.dd"
+    source.write_text("SET REG / REG1 /;\n")
+
+    kept = setup_work_dir(dd_dir, "case", tmp_path / "kept")
+    staged = kept / "model" / "base.dd"
+    staged.write_text("edited\n")
+    assert source.read_text() == "SET REG / REG1 /;\n"
+    assert not (kept / "runmodel.gms").is_symlink()
+
+    linked = setup_work_dir(dd_dir, "case", tmp_path / "linked", link_inputs=True)
+    assert (linked / "model" / "base.dd").samefile(source)
+    assert (linked / "runmodel.gms").samefile(get_scaffold_dir() / "runmodel.gms")
@@ -28,6 +28,15 @@ def test_compile_mini_plant():
     assert len(tableir["files"]) >= 1
 
 
+def test_load_vedalang_json_matches_yaml(tmp_path):
+    """A .veda.json source loads to the same dict as its YAML counterpart."""
+    source = load_vedalang(EXAMPLES_DIR / "mini_plant.veda.yaml")
+    json_path = tmp_path / "mini_plant.veda.json"
+    json_path.write_text(json.dumps(source))
+
+    assert load_vedalang(json_path) == source
+
+
 def test_output_validates_against_tableir_schema():
     """Compiler output must be valid TableIR."""
     source = load_vedalang(EXAMPLES_DIR / "mini_plant.veda.yaml")
@@ -84,6 +93,90 @@ def test_invalid_vedalang_rejected():
         compile_vedalang_to_tableir(invalid)
 
 
+def test_cached_validator_reports_same_error_as_jsonschema():
+    """Reused schema validators must raise the error jsonschema.validate picks."""
+    invalid = {"model": {"name": "Test", "regions": "REG1"}}
+    with open(SCHEMA_DIR / "vedalang.schema.json") as f:
+        schema = json.load(f)
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(invalid, schema)
+
+    for _ in range(2):
+        with pytest.raises(jsonschema.ValidationError) as exc_info:
+            compile_vedalang_to_tableir(invalid)
+        assert exc_info.value.message == expected.value.message
+        assert list(exc_info.value.path) == list(expected.value.path)
+
+
+def test_schemas_and_validators_are_loaded_once():
+    """Schema files are parsed, and validators built, once per process."""
+    from vedalang.compiler import compiler
+
+    assert compiler.load_vedalang_schema() is compiler.load_vedalang_schema()
+    assert compiler.load_tableir_schema() is compiler.load_tableir_schema()
+    assert compiler._vedalang_validator() is compiler._vedalang_validator()
+    assert compiler._tableir_validator() is compiler._tableir_validator()
+
+
+def test_validation_leaves_cached_schema_untouched():
+    """Validators must not rewrite the shared, cached schema dict."""
+    from vedalang.compiler.compiler import load_vedalang_schema
+
+    with open(SCHEMA_DIR / "vedalang.schema.json") as f:
+        pristine = json.load(f)
+    compile_vedalang_to_tableir(load_vedalang(EXAMPLES_DIR / "mini_plant.veda.yaml"))
+    assert load_vedalang_schema() == pristine
+
+
+def test_output_validation_is_opt_in(monkeypatch):
+    """TableIR output is only re-validated on request (or with validate=True)."""
+    from vedalang.compiler import compiler
+
+    def fail():
+        raise AssertionError("TableIR validation ran")
+
+    monkeypatch.setattr(compiler, "_tableir_validator", fail)
+    source = load_vedalang(EXAMPLES_DIR / "mini_plant.veda.yaml")
+
+    compile_vedalang_to_tableir(source)
+    compile_vedalang_to_tableir(source, validate=False)
+    with pytest.raises(AssertionError, match="TableIR validation ran"):
+        compile_vedalang_to_tableir(source, validate_output=True)
+    with pytest.raises(AssertionError, match="TableIR validation ran"):
+        compile_vedalang_to_tableir(source, validate=True)
+
+
+def test_unvalidated_non_string_names_compile():
+    """Names parsed from YAML as ints still compile with validate=False."""
+    source = {
+        "model": {
+            "name": "IntNames",
+            "regions": ["REG1"],
+            "commodities": [{"name": 100, "type": "energy"}],
+            "processes": [
+                {
+                    "name": 200,
+                    "sets": ["ELE"],
+                    "primary_commodity_group": "NRGO",
+                    "inputs": [{"commodity": 100}],
+                    "outputs": [{"commodity": 100}],
+                }
+            ],
+        }
+    }
+    tableir = compile_vedalang_to_tableir(source, validate=False)
+
+    tables = {
+        t["tag"]: t["rows"]
+        for f in tableir["files"]
+        for s in f["sheets"]
+        for t in s["tables"]
+    }
+    assert tables["~FI_COMM"][0]["commodity"] == 100
+    assert tables["~FI_PROCESS"][0]["process"] == 200
+    assert [r.get("commodity-in") for r in tables["~FI_T"]] == [100, None]
+
+
 def test_process_cost_attributes():
     """Process cost attributes should appear in ~FI_T table."""
     source = {
@@ -224,6 +317,37 @@ def test_demand_projection_scenario():
     assert values_by_year[2050] == 160.0
 
 
+def test_series_expansion_keeps_value_types_across_calls():
+    """Series sharing year keys must not leak values between calls (1 == 1.0)."""
+    from vedalang.compiler.compiler import _expand_series_to_years
+
+    years = [2020, 2030]
+    as_int = _expand_series_to_years({"2020": 1, "2030": 2}, years, "none")
+    as_float = _expand_series_to_years({"2020": 1.0, "2030": 2.0}, years, "none")
+
+    assert [type(v) for v in as_int.values()] == [int, int]
+    assert [type(v) for v in as_float.values()] == [float, float]
+
+
+def test_single_point_series_extrapolation_by_mode():
+    """A single point fills every year only under full interp_extrap."""
+    from vedalang.compiler.compiler import _expand_series_to_years
+
+    years = [2020, 2030, 2040]
+    point = {"2030": 5.0}
+
+    assert _expand_series_to_years(point, years, "interp_extrap") == {
+        2020: 5.0, 2030: 5.0, 2040: 5.0
+    }
+    assert _expand_series_to_years(point, years, "interp_extrap_back") == {
+        2020: 5.0, 2030: 5.0
+    }
+    assert _expand_series_to_years(point, years, "interp_extrap_forward") == {
+        2030: 5.0, 2040: 5.0
+    }
+    assert _expand_series_to_years(point, years, "none") == {2030: 5.0}
+
+
 def test_demand_projection_creates_scenario_file():
     """demand_projection SHOULD create a separate Scen_* scenario file.
 
@@ -2259,6 +2383,21 @@ def test_explicit_unit_overrides_default():
     assert elc_row["unit"] == "TWh"
 
 
+def test_normalize_process_flows_copies_only_for_shorthand():
+    """Long-form processes are passed through; shorthand ones are copied."""
+    from vedalang.compiler.compiler import _normalize_process_flows
+
+    long_form = {"name": "P1", "inputs": [{"commodity": "NG"}]}
+    assert _normalize_process_flows(long_form) is long_form
+
+    shorthand = {"name": "P2", "input": "NG", "output": "ELC"}
+    normalized = _normalize_process_flows(shorthand)
+    assert normalized is not shorthand
+    assert normalized["inputs"] == [{"commodity": "NG"}]
+    assert normalized["outputs"] == [{"commodity": "ELC"}]
+    assert shorthand == {"name": "P2", "input": "NG", "output": "ELC"}
+
+
 def test_shorthand_validation_unknown_commodity():
     """Unknown commodity in shorthand syntax should raise SemanticValidationError."""
     source = {
@@ -56,7 +56,7 @@ def run_check(
         # Step 1: Get TableIR
         if from_vedalang:
             source = load_vedalang(input_path)
-            tableir = compile_vedalang_to_tableir(source)
+            tableir = compile_vedalang_to_tableir(source, validate_output=True)
         elif from_tableir:
             tableir = load_tableir(input_path)
         else:
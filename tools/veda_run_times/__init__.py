@@ -1,5 +1,5 @@
 """veda_run_times - Run TIMES models through GAMS."""
 
-from .runner import RunResult, run_times
+from .runner import RunResult, run_times, run_times_batch
 
-__all__ = ["run_times", "RunResult"]
+__all__ = ["run_times", "run_times_batch", "RunResult"]
@@ -47,7 +47,7 @@ def format_result_table(result) -> str:
     if result.stderr and not result.success:
         lines.append("")
         lines.append("GAMS stderr (last 5 lines):")
-        for line in result.stderr.strip().split("\n")[-5:]:
+        for line in result.stderr_text.strip().split("\n")[-5:]:
             lines.append(f"  {line[:70]}")
 
     return "\n".join(lines)
@@ -1,64 +1,143 @@
 """Core logic for running TIMES models through GAMS."""
 
+import functools
+import mmap
 import os
 import re
 import shutil
 import subprocess
 import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, NamedTuple
 
-# Regex patterns for GAMS listing file parsing
+# Regex patterns for GAMS listing file parsing. Patterns are compiled in bytes
+# mode so they can run directly over a memory-mapped listing file without
+# decoding it; only the captured groups are decoded.
 # GAMS output uses formats like:
 #   **** MODEL STATUS      1 OPTIMAL
 #   **** SOLVER STATUS     1 NORMAL COMPLETION
 #   **** OBJECTIVE VALUE    123.456
 MODEL_STATUS_RE = re.compile(
-    r"^\s*\*{4}\s+MODEL STATUS\s+(\d+)\s*([A-Za-z][A-Za-z _-]*)?\s*$", re.MULTILINE
+    rb"^\s*\*{4}\s+MODEL STATUS\s+(\d+)\s*([A-Za-z][A-Za-z _-]*)?\s*$", re.MULTILINE
 )
 SOLVER_STATUS_RE = re.compile(
-    r"^\s*\*{4}\s+SOLVER STATUS\s+(\d+)\s*([A-Za-z][A-Za-z _-]*)?\s*$", re.MULTILINE
+    rb"^\s*\*{4}\s+SOLVER STATUS\s+(\d+)\s*([A-Za-z][A-Za-z _-]*)?\s*$", re.MULTILINE
 )
 OBJECTIVE_VALUE_RE = re.compile(
-    r"^\s*\*{4}\s+OBJECTIVE VALUE\s+([+-]?\d+(?:\.\d*)?(?:[eEdD][+-]?\d+)?)",
+    rb"^\s*\*{4}\s+OBJECTIVE VALUE\s+([+-]?\d+(?:\.\d*)?(?:[eEdD][+-]?\d+)?)",
     re.MULTILINE,
 )
-ERROR_LINE_RE = re.compile(r"^\s*\*{4}\s+(ERROR[^\n]*?)\s*$", re.MULTILINE)
-WARNING_LINE_RE = re.compile(r"^\s*\*{3}\s+(WARNING[^\n]*?)\s*$", re.MULTILINE)
-SYNTAX_ERROR_RE = re.compile(r"SYNTAX ERROR", re.IGNORECASE)
-DOMAIN_VIOLATION_RE = re.compile(r"DOMAIN VIOLATION", re.IGNORECASE)
-# Match infeasibility/unbounded indicators (simple patterns)
-INFEASIBLE_RE = re.compile(r"\bINFEASIB(?:LE|ILITY)\b", re.IGNORECASE)
-UNBOUNDED_RE = re.compile(r"\bUNBOUNDED\b", re.IGNORECASE)
-# Report summary lines that indicate zero issues (should not trigger flags)
-ZERO_INFEASIBLE_RE = re.compile(r"^\s*0\s+INFEASIBLE\s*$", re.MULTILINE)
-ZERO_UNBOUNDED_RE = re.compile(r"^\s*0\s+UNBOUNDED\s*$", re.MULTILINE)
-INTEGER_INFEASIBLE_RE = re.compile(r"INTEGER\s+INFEASIB", re.IGNORECASE)
-LICENSING_RE = re.compile(r"LICENS(?:E|ING)\s+(?:ERROR|PROBLEM|LIMIT)", re.IGNORECASE)
-UNKNOWN_SYMBOL_RE = re.compile(r"UNKNOWN\s+SYMBOL", re.IGNORECASE)
-SOLVER_NAME_RE = re.compile(r"^\s+SOLVER\s+(\w+)\s*$", re.MULTILINE)
-
-# IIS/Conflict Refiner patterns (CPLEX)
-CONFLICT_STATUS_RE = re.compile(r"Conflict Refiner status", re.IGNORECASE)
-IIS_EQUATIONS_RE = re.compile(
-    r"Number of equations in conflict:\s+(\d+)", re.IGNORECASE
+ERROR_LINE_RE = re.compile(rb"^\s*\*{4}\s+(ERROR[^\n]*?)\s*$", re.MULTILINE)
+WARNING_LINE_RE = re.compile(rb"^\s*\*{3}\s+(WARNING[^\n]*?)\s*$", re.MULTILINE)
+# Flag patterns are matched case-insensitively by running them over an
+# uppercased copy of the listing, so they are written in uppercase and compiled
+# without re.IGNORECASE (which would case-fold every character scanned).
+SYNTAX_ERROR_RE = re.compile(rb"SYNTAX ERROR")
+DOMAIN_VIOLATION_RE = re.compile(rb"DOMAIN VIOLATION")
+# Infeasibility/unbounded indicators, scanned in a single pass. The integer
+# alternative is a lookahead so that its INFEASIB... word is still visited by
+# the infeasible alternative.
+STATUS_WORD_RE = re.compile(
+    rb"\b(?:(?P<infeasible>INFEASIB(?:LE|ILITY))|(?P<unbounded>UNBOUNDED))\b"
+    rb"|(?=(?P<integer_infeasible>INTEGER\s+INFEASIB))"
 )
-IIS_VARIABLES_RE = re.compile(
-    r"Number of variables in conflict:\s+(\d+)", re.IGNORECASE
-)
-IIS_INDICATOR_RE = re.compile(
-    r"Number of indicator constraints in conflict:\s+(\d+)", re.IGNORECASE
+LICENSING_RE = re.compile(rb"LICENS(?:E|ING)\s+(?:ERROR|PROBLEM|LIMIT)")
+UNKNOWN_SYMBOL_RE = re.compile(rb"UNKNOWN\s+SYMBOL")
+# Single-line patterns, matched only against lines located by a substring
+# search for SOLVER / OBJECTIVE (see _match_marked_line)
+SOLVER_NAME_RE = re.compile(rb"\s+SOLVER\s+(\w+)\s*$")
+OBJECTIVE_NAME_RE = re.compile(
+    rb"\s*OBJECTIVE\s+(\w+)\s+(MINIMIZE|MAXIMIZE)?", re.IGNORECASE
 )
-IIS_SOS_RE = re.compile(r"Number of SOS sets in conflict:\s+(\d+)", re.IGNORECASE)
-IIS_MEMBER_RE = re.compile(
-    r"^\s*(upper|lower|equality|free|fixed|rng|sos|indic)\s*:\s*(.+)$",
-    re.IGNORECASE | re.MULTILINE,
+
+# Listing patterns are compiled once here and used through these names only;
+# an inline re.search(r"...") in the parser would pay re's cache lookup (and
+# possibly a recompile) on every call. tests/test_iis_parsing.py checks that
+# every *_RE name is a compiled pattern.
+
+# Uppercase ASCII sentinels that must occur in the (uppercased) listing for
+# the corresponding case-insensitive regex to match. A plain substring test is
+# far cheaper than a regex pass, and most listings contain none of them.
+# Conflict refiner output is detected by its sentinel alone.
+SYNTAX_ERROR_SENTINEL = b"SYNTAX ERROR"
+DOMAIN_VIOLATION_SENTINEL = b"DOMAIN VIOLATION"
+INFEASIBLE_SENTINEL = b"INFEASIB"
+UNBOUNDED_SENTINEL = b"UNBOUNDED"
+LICENSING_SENTINEL = b"LICENS"
+UNKNOWN_SYMBOL_SENTINEL = b"UNKNOWN"
+CONFLICT_STATUS_SENTINEL = b"CONFLICT REFINER STATUS"
+# Flag scans as (flag, sentinel, pattern); the infeasible, unbounded and
+# integer infeasible flags come from STATUS_WORD_RE instead. The scans are
+# kept separate rather than fused into one alternation: with the sentinel
+# gates most are skipped outright, and Python's backtracking engine runs a
+# single many-branch alternation several times slower than the literal-prefix
+# searches it replaces.
+FLAG_SCANS: tuple[tuple[str, bytes, re.Pattern[bytes]], ...] = (
+    ("syntax_error", SYNTAX_ERROR_SENTINEL, SYNTAX_ERROR_RE),
+    ("domain_violation", DOMAIN_VIOLATION_SENTINEL, DOMAIN_VIOLATION_RE),
+    ("licensing_problem", LICENSING_SENTINEL, LICENSING_RE),
+    ("unknown_symbol", UNKNOWN_SYMBOL_SENTINEL, UNKNOWN_SYMBOL_RE),
 )
-OBJECTIVE_NAME_RE = re.compile(
-    r"^\s*OBJECTIVE\s+(\w+)\s+(MINIMIZE|MAXIMIZE)?", re.MULTILINE | re.IGNORECASE
+STATUS_WORD_FLAGS = frozenset({"infeasible", "unbounded", "integer_infeasible"})
+# Solve summary markers. The status regexes only need to scan a window
+# starting shortly before the first of them (the first solve is reported).
+MODEL_STATUS_MARKER = b"**** MODEL STATUS"
+SOLVE_SUMMARY_MARKERS = (
+    MODEL_STATUS_MARKER,
+    b"**** SOLVER STATUS",
+    b"**** OBJECTIVE VALUE",
 )
+SOLVE_SUMMARY_SLACK = 4096
+# Upper bounds on how many matches are kept from error-heavy listings
+MAX_LISTING_MESSAGES = 20
+MAX_IIS_MEMBERS = 200
+# Listings at or above this size are read in line-aligned chunks and only the
+# chunks the parser needs are retained; smaller ones are memory-mapped whole.
+LISTING_STREAM_THRESHOLD = 32 * 1024 * 1024
+LISTING_CHUNK_SIZE = 1024 * 1024
+
+
+class IISPatterns(NamedTuple):
+    """Compiled IIS/Conflict Refiner patterns (CPLEX)."""
+
+    equations: re.Pattern[bytes]
+    variables: re.Pattern[bytes]
+    indicator: re.Pattern[bytes]
+    sos: re.Pattern[bytes]
+    member: re.Pattern[bytes]
+    section_end: re.Pattern[bytes]
+
+
+@functools.cache
+def _iis_patterns() -> IISPatterns:
+    """Compile the IIS patterns on first use.
+
+    Conflict refiner output only appears in CPLEX runs on infeasible models,
+    so the common path never needs these.
+    """
+    return IISPatterns(
+        # Count patterns run over the uppercased conflict section
+        equations=re.compile(rb"NUMBER OF EQUATIONS IN CONFLICT:\s+(\d+)"),
+        variables=re.compile(rb"NUMBER OF VARIABLES IN CONFLICT:\s+(\d+)"),
+        indicator=re.compile(
+            rb"NUMBER OF INDICATOR CONSTRAINTS IN CONFLICT:\s+(\d+)"
+        ),
+        sos=re.compile(rb"NUMBER OF SOS SETS IN CONFLICT:\s+(\d+)"),
+        # Member lines keep their original case for the symbol names
+        member=re.compile(
+            rb"^\s*(upper|lower|equality|free|fixed|rng|sos|indic)\s*:\s*(.+)$",
+            re.IGNORECASE | re.MULTILINE,
+        ),
+        # End of the conflict section: double blank line or a major section
+        # marker (e.g., "****", "---", or start of new GAMS output)
+        section_end=re.compile(rb"\n\s*\n\s*\n|\n\*{4}|\n-{3,}"),
+    )
+
 
 # Model status codes -> category
 MODEL_STATUS_CATEGORIES = {
@@ -101,6 +180,42 @@ SOLVER_STATUS_CATEGORIES = {
 }
 
 
+def _category_lut(categories: dict[int, str]) -> tuple[str, ...]:
+    """Build a code-indexed lookup table from a status category mapping."""
+    return tuple(categories.get(code, "unknown") for code in range(max(categories) + 1))
+
+
+# Status codes are small and dense, so lookups index these tuples directly.
+# The dicts above remain the source of truth.
+MODEL_STATUS_LUT = _category_lut(MODEL_STATUS_CATEGORIES)
+SOLVER_STATUS_LUT = _category_lut(SOLVER_STATUS_CATEGORIES)
+
+
+def _status_category(lut: tuple[str, ...], code: int) -> str:
+    """Look up a status category, returning "unknown" for unlisted codes."""
+    return lut[code] if 0 <= code < len(lut) else "unknown"
+
+
+# Solver option file written for CPLEX runs: enables the conflict refiner
+# (IIS) so infeasible models report the conflicting constraints
+CPLEX_OPT_CONTENT = (
+    b"* Automatically generated by veda_run_times\n"
+    b"* Enable conflict refiner / IIS when model is infeasible\n"
+    b"iis 1\n"
+    b"conflictdisplay 2\n"
+    b"names 1\n"
+    b"rerun auto\n"
+)
+
+# GAMS driver files staged from the scaffold into every work dir
+SCAFFOLD_FILES = ("runmodel.gms", "scenario.run", "gams.opt")
+
+# Legacy model status values treated as success when no diagnostics exist
+LEGACY_OK_MODEL_STATUSES = frozenset(
+    {None, "1", "OPTIMAL", "2", "LOCALLY OPTIMAL", "8", "INTEGER SOLUTION"}
+)
+
+
 @dataclass
 class RunResult:
     """Result of a TIMES model run."""
@@ -118,10 +233,21 @@ class RunResult:
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
     diagnostics: dict[str, Any] | None = None
-    stdout: str = ""
-    stderr: str = ""
+    stdout: bytes = b""
+    stderr: bytes = b""
+
+    @functools.cached_property
+    def stdout_text(self) -> str:
+        """GAMS stdout, decoded on first access."""
+        return self.stdout.decode(errors="replace")
 
+    @functools.cached_property
+    def stderr_text(self) -> str:
+        """GAMS stderr, decoded on first access."""
+        return self.stderr.decode(errors="replace")
 
+
+@functools.cache
 def find_times_source() -> Path | None:
     """Locate TIMES source directory.
 
@@ -129,6 +255,9 @@ def find_times_source() -> Path | None:
     1. TIMES_SRC environment variable
     2. ~/TIMES_model (common user install)
     3. Subdirectory in workspace
+
+    The result is cached per process; call ``reset_path_cache()`` after
+    changing TIMES_SRC or installing TIMES.
     """
     if env_path := os.environ.get("TIMES_SRC"):
         p = Path(env_path)
@@ -142,27 +271,59 @@ def find_times_source() -> Path | None:
     return None
 
 
+@functools.cache
 def get_scaffold_dir() -> Path:
     """Get path to the GAMS scaffold directory."""
     return Path(__file__).parent.parent.parent / "xl2times" / "gams_scaffold"
 
 
+def reset_path_cache() -> None:
+    """Clear the cached TIMES source and scaffold directory lookups."""
+    find_times_source.cache_clear()
+    get_scaffold_dir.cache_clear()
+
+
+def _stage_file(src: Path, dst: Path, link: bool = False) -> None:
+    """Place ``src`` at ``dst``, replacing whatever is there.
+
+    Copies with ``shutil.copyfile`` (``sendfile``/``copy_file_range`` on
+    Linux). With ``link``, a hard link is tried first, falling back to the
+    copy (e.g. across filesystems). A hard link shares the inode with the
+    source, so edits in the work dir would change the xl2times output; only
+    link into work dirs that are not kept.
+    """
+    dst.unlink(missing_ok=True)
+    if link:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
 def setup_work_dir(
     dd_dir: Path,
     case: str,
     work_dir: Path | None = None,
     times_src: Path | None = None,
+    link_inputs: bool = False,
 ) -> Path:
     """Set up the GAMS working directory with all required files.
 
+    With ``link_inputs``, DD files are hard-linked and scaffold files
+    symlinked rather than copied. Edits in such a work dir would reach the
+    xl2times output and the tracked scaffold, so only use it for throwaway
+    work dirs (see ``_stage_file``).
+
     Creates:
       work_dir/
         source/ -> symlink to TIMES source
         model/  -> DD files
         scenarios/ -> (empty, for compatibility)
-        runmodel.gms
-        scenario.run
-        gams.opt
+        runmodel.gms -> scaffold copy (symlink with link_inputs)
+        scenario.run -> scaffold copy (symlink with link_inputs)
+        gams.opt -> scaffold copy (symlink with link_inputs)
     """
     if work_dir is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -184,246 +345,587 @@ def setup_work_dir(
     model_dir.mkdir(exist_ok=True)
 
     for dd_file in dd_dir.glob("*.dd"):
-        shutil.copy(dd_file, model_dir / dd_file.name)
+        _stage_file(dd_file, model_dir / dd_file.name, link=link_inputs)
 
     scenarios_dir = work_dir / "scenarios"
     scenarios_dir.mkdir(exist_ok=True)
 
-    for scaffold_file in ["runmodel.gms", "scenario.run", "gams.opt"]:
+    for scaffold_file in SCAFFOLD_FILES:
         src = scaffold / scaffold_file
         if src.exists():
-            shutil.copy(src, work_dir / scaffold_file)
+            # Unlink first so a symlink left in a reused work dir is replaced,
+            # not written through
+            dst = work_dir / scaffold_file
+            dst.unlink(missing_ok=True)
+            if link_inputs:
+                try:
+                    dst.symlink_to(src.resolve())
+                    continue
+                except OSError:
+                    pass  # Symlinks unavailable (e.g. Windows); copy instead
+            shutil.copyfile(src, dst)
 
     return work_dir
 
 
-def parse_gams_listing(content: str) -> dict[str, Any]:
-    """Parse GAMS listing file content into structured diagnostics.
+@dataclass(slots=True)
+class StatusInfo:
+    """A model or solver status line."""
 
-    Returns comprehensive diagnostic structure for AI agent consumption.
-    """
-    # Initialize the full diagnostic structure
-    diag: dict[str, Any] = {
-        "compilation": {"ok": True, "errors": [], "warnings": []},
-        "execution": {
-            "ran_solver": False,
-            "model_status": {"code": None, "text": None, "category": None},
-            "solve_status": {"code": None, "text": None, "category": None},
-            "objective": {"value": None, "name": None, "sense": None},
-            "solver": None,
-        },
-        "flags": {
-            "syntax_error": False,
-            "domain_violation": False,
-            "infeasible": False,
-            "unbounded": False,
-            "integer_infeasible": False,
-            "solver_failure": False,
-            "licensing_problem": False,
-            "unknown_symbol": False,
-        },
-        "summary": {"ok": True, "problem_type": None, "message": ""},
-        "messages": {"errors": [], "warnings": [], "info": []},
-        "raw": {
-            "model_status_line": None,
-            "solve_status_line": None,
-            "objective_line": None,
-        },
-        "iis": {
-            "available": False,
-            "counts": {
-                "equations": None,
-                "variables": None,
-                "indicator_constraints": None,
-                "sos_sets": None,
+    code: int | None = None
+    text: str | None = None
+    category: str | None = None
+
+
+@dataclass(slots=True)
+class ObjectiveInfo:
+    """Objective value, name and sense."""
+
+    value: float | None = None
+    name: str | None = None
+    sense: str | None = None
+
+
+@dataclass(slots=True)
+class Compilation:
+    """GAMS compilation outcome."""
+
+    ok: bool = True
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Execution:
+    """Solver execution outcome."""
+
+    ran_solver: bool = False
+    model_status: StatusInfo = field(default_factory=StatusInfo)
+    solve_status: StatusInfo = field(default_factory=StatusInfo)
+    objective: ObjectiveInfo = field(default_factory=ObjectiveInfo)
+    solver: str | None = None
+
+
+@dataclass(slots=True)
+class Flags:
+    """Problem indicators detected in the listing."""
+
+    syntax_error: bool = False
+    domain_violation: bool = False
+    infeasible: bool = False
+    unbounded: bool = False
+    integer_infeasible: bool = False
+    solver_failure: bool = False
+    licensing_problem: bool = False
+    unknown_symbol: bool = False
+
+
+@dataclass(slots=True)
+class Summary:
+    """Overall verdict on the run."""
+
+    ok: bool = True
+    problem_type: str | None = None
+    message: str = ""
+
+
+@dataclass(slots=True)
+class Messages:
+    """Messages collected from the listing."""
+
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    info: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Raw:
+    """Raw status lines as they appear in the listing."""
+
+    model_status_line: str | None = None
+    solve_status_line: str | None = None
+    objective_line: str | None = None
+
+
+@dataclass(slots=True)
+class IISCounts:
+    """Conflict sizes reported by the CPLEX conflict refiner."""
+
+    equations: int | None = None
+    variables: int | None = None
+    indicator_constraints: int | None = None
+    sos_sets: int | None = None
+
+
+@dataclass(slots=True)
+class IISMember:
+    """A single constraint or bound in the conflict set."""
+
+    role: str
+    symbol: str
+    detail: str
+
+
+@dataclass(slots=True)
+class IIS:
+    """CPLEX conflict refiner (IIS) output."""
+
+    available: bool = False
+    counts: IISCounts = field(default_factory=IISCounts)
+    members: list[IISMember] = field(default_factory=list)
+    raw_section: str | None = None
+
+
+@dataclass(slots=True)
+class Diagnostics:
+    """Structured diagnostics parsed from a GAMS listing."""
+
+    compilation: Compilation = field(default_factory=Compilation)
+    execution: Execution = field(default_factory=Execution)
+    flags: Flags = field(default_factory=Flags)
+    summary: Summary = field(default_factory=Summary)
+    messages: Messages = field(default_factory=Messages)
+    raw: Raw = field(default_factory=Raw)
+    iis: IIS = field(default_factory=IIS)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the nested-dict form used by ``parse_gams_listing``.
+
+        Built field by field instead of with ``dataclasses.asdict``, which
+        deep-copies every nested list; the result shares the message lists.
+        """
+        execution = self.execution
+        iis = self.iis
+        return {
+            "compilation": _slots_dict(self.compilation),
+            "execution": {
+                "ran_solver": execution.ran_solver,
+                "model_status": _slots_dict(execution.model_status),
+                "solve_status": _slots_dict(execution.solve_status),
+                "objective": _slots_dict(execution.objective),
+                "solver": execution.solver,
             },
-            "members": [],
-            "raw_section": None,
-        },
-    }
+            "flags": _slots_dict(self.flags),
+            "summary": _slots_dict(self.summary),
+            "messages": _slots_dict(self.messages),
+            "raw": _slots_dict(self.raw),
+            "iis": {
+                "available": iis.available,
+                "counts": _slots_dict(iis.counts),
+                "members": [_slots_dict(member) for member in iis.members],
+                "raw_section": iis.raw_section,
+            },
+        }
 
-    # Parse compilation errors
-    error_matches = ERROR_LINE_RE.findall(content)
-    if error_matches:
-        diag["compilation"]["ok"] = False
-        diag["compilation"]["errors"] = error_matches[:20]
-        diag["messages"]["errors"].extend(error_matches[:20])
 
-    # Parse warnings
-    warning_matches = WARNING_LINE_RE.findall(content)
-    if warning_matches:
-        diag["compilation"]["warnings"] = warning_matches[:20]
-        diag["messages"]["warnings"].extend(warning_matches[:20])
+def _slots_dict(obj: Any) -> dict[str, Any]:
+    """Shallow dict of a flat slotted dataclass, in field order."""
+    return {name: getattr(obj, name) for name in obj.__slots__}
 
-    # Detect problem flags from content
-    diag["flags"]["syntax_error"] = bool(SYNTAX_ERROR_RE.search(content))
-    diag["flags"]["domain_violation"] = bool(DOMAIN_VIOLATION_RE.search(content))
-    # Check for infeasible/unbounded, but exclude "0 INFEASIBLE" summary lines
-    has_infeasible = bool(INFEASIBLE_RE.search(content))
-    has_zero_infeasible = bool(ZERO_INFEASIBLE_RE.search(content))
-    diag["flags"]["infeasible"] = has_infeasible and not has_zero_infeasible
-    has_unbounded = bool(UNBOUNDED_RE.search(content))
-    has_zero_unbounded = bool(ZERO_UNBOUNDED_RE.search(content))
-    diag["flags"]["unbounded"] = has_unbounded and not has_zero_unbounded
-    diag["flags"]["integer_infeasible"] = bool(INTEGER_INFEASIBLE_RE.search(content))
-    diag["flags"]["licensing_problem"] = bool(LICENSING_RE.search(content))
-    diag["flags"]["unknown_symbol"] = bool(UNKNOWN_SYMBOL_RE.search(content))
-
-    if diag["flags"]["syntax_error"]:
-        diag["compilation"]["ok"] = False
+
+def _decode(raw: bytes) -> str:
+    """Decode a captured listing fragment, replacing undecodable bytes."""
+    return raw.decode(errors="replace")
+
+
+def _gated_search(pattern: re.Pattern[bytes], sentinel: bytes, upper: bytes) -> bool:
+    """Run ``pattern`` over ``upper`` only if ``sentinel`` occurs in it."""
+    return sentinel in upper and pattern.search(upper) is not None
+
+
+def _is_zero_summary(upper: bytes, match: re.Match[bytes]) -> bool:
+    """Whether ``match`` is the word of a "0 INFEASIBLE"-style summary line."""
+    line_start = upper.rfind(b"\n", 0, match.start()) + 1
+    line_end = upper.find(b"\n", match.end())
+    if line_end == -1:
+        line_end = len(upper)
+    return (
+        upper[line_start : match.start()].strip() == b"0"
+        and not upper[match.end() : line_end].strip()
+    )
+
+
+def _status_word_flags(upper: bytes) -> set[str]:
+    """Return the infeasible/unbounded flags raised by an uppercased listing.
+
+    Words on report summary lines that count zero occurrences (for example
+    ``0 INFEASIBLE``) are ignored, but other occurrences still count.
+    """
+    found: set[str] = set()
+    if INFEASIBLE_SENTINEL not in upper and UNBOUNDED_SENTINEL not in upper:
+        return found
+    for match in STATUS_WORD_RE.finditer(upper):
+        flag = match.lastgroup
+        if flag in found or _is_zero_summary(upper, match):
+            continue
+        found.add(flag)
+        if found == STATUS_WORD_FLAGS:
+            break
+    return found
+
+
+def _first_n(pattern: re.Pattern[bytes], content: Any, n: int) -> list[str]:
+    """Return the decoded first group of at most ``n`` matches of ``pattern``."""
+    return [_decode(m.group(1)) for m in islice(pattern.finditer(content), n)]
+
+
+def _match_marked_line(
+    pattern: re.Pattern[bytes],
+    content: Any,
+    haystack: Any,
+    needle: bytes,
+    start: int = 0,
+) -> re.Match[bytes] | None:
+    """Match ``pattern`` against lines of ``content`` that contain ``needle``.
+
+    Candidate lines are located with a plain substring search in ``haystack``
+    (``content`` itself or its uppercased copy, which share offsets), so the
+    regex only ever runs over single lines instead of the whole listing. The
+    line is matched with its newline, which counts as trailing whitespace.
+    """
+    pos = haystack.find(needle, start)
+    while pos != -1:
+        line_start = content.rfind(b"\n", 0, pos) + 1
+        line_end = content.find(b"\n", pos)
+        if line_end == -1:
+            line_end = len(content)
+        match = pattern.match(content[line_start : line_end + 1])
+        if match:
+            return match
+        pos = haystack.find(needle, line_end)
+    return None
+
+
+def _solve_summary_start(content: Any) -> int:
+    """Return the offset from which to scan for solve summary lines.
+
+    Locates the first occurrence of each solve summary marker and backs off by
+    ``SOLVE_SUMMARY_SLACK`` bytes, so that a listing with several solves
+    reports the first one. Falls back to 0 when no marker is present.
+    """
+    positions = [
+        pos for marker in SOLVE_SUMMARY_MARKERS if (pos := content.find(marker)) != -1
+    ]
+    if not positions:
+        return 0
+    return max(min(positions) - SOLVE_SUMMARY_SLACK, 0)
+
+
+def _parse_solve_summary(diag: Diagnostics, content: Any, upper: bytes) -> None:
+    """Fill in model/solver status, objective and solver name from a listing."""
+    execution = diag.execution
 
     # Parse model status
-    model_match = MODEL_STATUS_RE.search(content)
+    tail_start = _solve_summary_start(content)
+    model_match = MODEL_STATUS_RE.search(content, tail_start)
     if model_match:
-        diag["raw"]["model_status_line"] = model_match.group(0).strip()
+        diag.raw.model_status_line = _decode(model_match.group(0).strip())
         code = int(model_match.group(1))
-        text = model_match.group(2).strip() if model_match.group(2) else None
-        diag["execution"]["model_status"] = {
-            "code": code,
-            "text": text,
-            "category": MODEL_STATUS_CATEGORIES.get(code, "unknown"),
-        }
-        diag["execution"]["ran_solver"] = True
+        text = _decode(model_match.group(2).strip()) if model_match.group(2) else None
+        execution.model_status = StatusInfo(
+            code=code,
+            text=text,
+            category=_status_category(MODEL_STATUS_LUT, code),
+        )
+        execution.ran_solver = True
 
     # Parse solver status
-    solver_match = SOLVER_STATUS_RE.search(content)
+    solver_match = SOLVER_STATUS_RE.search(content, tail_start)
     if solver_match:
-        diag["raw"]["solve_status_line"] = solver_match.group(0).strip()
+        diag.raw.solve_status_line = _decode(solver_match.group(0).strip())
         code = int(solver_match.group(1))
-        text = solver_match.group(2).strip() if solver_match.group(2) else None
-        diag["execution"]["solve_status"] = {
-            "code": code,
-            "text": text,
-            "category": SOLVER_STATUS_CATEGORIES.get(code, "unknown"),
-        }
+        text = _decode(solver_match.group(2).strip()) if solver_match.group(2) else None
+        category = _status_category(SOLVER_STATUS_LUT, code)
+        execution.solve_status = StatusInfo(code=code, text=text, category=category)
         # Check for solver failure
-        if SOLVER_STATUS_CATEGORIES.get(code) in ("solver_failure", "system_failure"):
-            diag["flags"]["solver_failure"] = True
+        if category in ("solver_failure", "system_failure"):
+            diag.flags.solver_failure = True
 
     # Parse objective value
-    obj_match = OBJECTIVE_VALUE_RE.search(content)
+    obj_match = OBJECTIVE_VALUE_RE.search(content, tail_start)
     if obj_match:
-        diag["raw"]["objective_line"] = obj_match.group(0).strip()
+        diag.raw.objective_line = _decode(obj_match.group(0).strip())
         try:
             # Handle Fortran-style 'D' exponent notation
-            val_str = obj_match.group(1).replace("d", "e").replace("D", "e")
-            diag["execution"]["objective"]["value"] = float(val_str)
+            val_str = _decode(obj_match.group(1)).replace("d", "e").replace("D", "e")
+            execution.objective.value = float(val_str)
         except ValueError:
             pass
 
     # Parse objective name and sense
-    obj_name_match = OBJECTIVE_NAME_RE.search(content)
+    obj_name_match = _match_marked_line(
+        OBJECTIVE_NAME_RE, content, upper, b"OBJECTIVE"
+    )
     if obj_name_match:
-        diag["execution"]["objective"]["name"] = obj_name_match.group(1)
+        execution.objective.name = _decode(obj_name_match.group(1))
         if obj_name_match.group(2):
-            diag["execution"]["objective"]["sense"] = obj_name_match.group(2).upper()
+            execution.objective.sense = _decode(obj_name_match.group(2)).upper()
 
     # Parse solver name
-    solver_name_match = SOLVER_NAME_RE.search(content)
+    solver_name_match = _match_marked_line(
+        SOLVER_NAME_RE, content, content, b"SOLVER", tail_start
+    )
     if solver_name_match:
-        diag["execution"]["solver"] = solver_name_match.group(1)
+        execution.solver = _decode(solver_name_match.group(1))
+
 
-    # Build summary
-    model_cat = diag["execution"]["model_status"]["category"]
-    solver_cat = diag["execution"]["solve_status"]["category"]
+def _summarize(diag: Diagnostics) -> None:
+    """Derive the overall summary from the parsed diagnostics."""
+    flags = diag.flags
+    summary = diag.summary
+    model_cat = diag.execution.model_status.category
+    solver_cat = diag.execution.solve_status.category
 
     # Determine overall OK status
     is_ok = (
-        diag["compilation"]["ok"]
+        diag.compilation.ok
         and model_cat in ("optimal", "solved", "solved_unique", None)
         and solver_cat in ("ok", None)
         and not any(
             [
-                diag["flags"]["syntax_error"],
-                diag["flags"]["domain_violation"],
-                diag["flags"]["infeasible"],
-                diag["flags"]["unbounded"],
-                diag["flags"]["solver_failure"],
-                diag["flags"]["licensing_problem"],
+                flags.syntax_error,
+                flags.domain_violation,
+                flags.infeasible,
+                flags.unbounded,
+                flags.solver_failure,
+                flags.licensing_problem,
             ]
         )
     )
-    diag["summary"]["ok"] = is_ok
+    summary.ok = is_ok
 
     # Determine problem type
-    if diag["flags"]["syntax_error"]:
-        diag["summary"]["problem_type"] = "syntax_error"
-        diag["summary"]["message"] = "GAMS compilation failed due to syntax error"
-    elif diag["flags"]["licensing_problem"] or model_cat == "licensing":
-        diag["summary"]["problem_type"] = "licensing"
-        diag["summary"]["message"] = "GAMS licensing problem encountered"
-    elif diag["flags"]["infeasible"] or model_cat == "infeasible":
-        diag["summary"]["problem_type"] = "infeasible"
-        diag["summary"]["message"] = "Model is infeasible - no solution exists"
-    elif diag["flags"]["unbounded"] or model_cat == "unbounded":
-        diag["summary"]["problem_type"] = "unbounded"
-        diag["summary"]["message"] = "Model is unbounded"
-    elif diag["flags"]["solver_failure"]:
-        diag["summary"]["problem_type"] = "solver_failure"
-        diag["summary"]["message"] = "Solver failed during execution"
-    elif diag["flags"]["domain_violation"]:
-        diag["summary"]["problem_type"] = "domain_violation"
-        diag["summary"]["message"] = "Domain violation in model"
-    elif not diag["compilation"]["ok"]:
-        diag["summary"]["problem_type"] = "compilation_error"
-        diag["summary"]["message"] = "GAMS compilation failed"
+    if flags.syntax_error:
+        summary.problem_type = "syntax_error"
+        summary.message = "GAMS compilation failed due to syntax error"
+    elif flags.licensing_problem or model_cat == "licensing":
+        summary.problem_type = "licensing"
+        summary.message = "GAMS licensing problem encountered"
+    elif flags.infeasible or model_cat == "infeasible":
+        summary.problem_type = "infeasible"
+        summary.message = "Model is infeasible - no solution exists"
+    elif flags.unbounded or model_cat == "unbounded":
+        summary.problem_type = "unbounded"
+        summary.message = "Model is unbounded"
+    elif flags.solver_failure:
+        summary.problem_type = "solver_failure"
+        summary.message = "Solver failed during execution"
+    elif flags.domain_violation:
+        summary.problem_type = "domain_violation"
+        summary.message = "Domain violation in model"
+    elif not diag.compilation.ok:
+        summary.problem_type = "compilation_error"
+        summary.message = "GAMS compilation failed"
     elif is_ok:
-        diag["summary"]["problem_type"] = None
-        obj_val = diag["execution"]["objective"]["value"]
+        summary.problem_type = None
+        obj_val = diag.execution.objective.value
         if obj_val is not None:
-            diag["summary"]["message"] = f"Solved successfully, objective = {obj_val}"
+            summary.message = f"Solved successfully, objective = {obj_val}"
         else:
-            diag["summary"]["message"] = "Solved successfully"
+            summary.message = "Solved successfully"
     else:
-        diag["summary"]["problem_type"] = "unknown"
-        diag["summary"]["message"] = f"Unknown issue: model={model_cat}, solver={solver_cat}"  # noqa: E501
+        summary.problem_type = "unknown"
+        summary.message = f"Unknown issue: model={model_cat}, solver={solver_cat}"
 
-    # --- IIS / Conflict Refiner parsing (CPLEX) ---
-    if CONFLICT_STATUS_RE.search(content):
-        conflict_start = content.find("Conflict Refiner status")
+
+def _parse_iis(diag: Diagnostics, content: Any, upper: bytes) -> None:
+    """Extract CPLEX conflict refiner (IIS) output, if present."""
+    if CONFLICT_STATUS_SENTINEL in upper:
+        iis = _iis_patterns()
+        conflict_start = content.find(b"Conflict Refiner status")
         if conflict_start != -1:
-            tail = content[conflict_start:]
-            # Find end of conflict section: look for double blank line or major
-            # section markers (e.g., "****", "---", or start of new GAMS output)
-            section_end = re.search(r"\n\s*\n\s*\n|\n\*{4}|\n-{3,}", tail)
-            section = tail[: section_end.start()] if section_end else tail
-            section = section.strip()
+            section_end = iis.section_end.search(content, conflict_start)
+            end = section_end.start() if section_end else len(content)
+            section = content[conflict_start:end].strip()
 
-            diag["iis"]["available"] = True
-            diag["iis"]["raw_section"] = section
+            diag.iis.available = True
+            diag.iis.raw_section = _decode(section)
 
             # Extract counts
-            eq_m = IIS_EQUATIONS_RE.search(section)
-            var_m = IIS_VARIABLES_RE.search(section)
-            ind_m = IIS_INDICATOR_RE.search(section)
-            sos_m = IIS_SOS_RE.search(section)
+            upper_section = section.upper()
+            eq_m = iis.equations.search(upper_section)
+            var_m = iis.variables.search(upper_section)
+            ind_m = iis.indicator.search(upper_section)
+            sos_m = iis.sos.search(upper_section)
 
+            counts = diag.iis.counts
             if eq_m:
-                diag["iis"]["counts"]["equations"] = int(eq_m.group(1))
+                counts.equations = int(eq_m.group(1))
             if var_m:
-                diag["iis"]["counts"]["variables"] = int(var_m.group(1))
+                counts.variables = int(var_m.group(1))
             if ind_m:
-                diag["iis"]["counts"]["indicator_constraints"] = int(ind_m.group(1))
+                counts.indicator_constraints = int(ind_m.group(1))
             if sos_m:
-                diag["iis"]["counts"]["sos_sets"] = int(sos_m.group(1))
+                counts.sos_sets = int(sos_m.group(1))
 
             # Extract individual conflicting members
-            for role, rest in IIS_MEMBER_RE.findall(section):
-                rest = rest.strip()
+            members = islice(iis.member.finditer(section), MAX_IIS_MEMBERS)
+            for member in members:
+                role = _decode(member.group(1))
+                rest = _decode(member.group(2)).strip()
                 parts = rest.split(None, 1)
                 symbol = parts[0] if parts else rest
                 detail = parts[1] if len(parts) > 1 else ""
-                diag["iis"]["members"].append(
-                    {
-                        "role": role.lower(),
-                        "symbol": symbol,
-                        "detail": detail,
-                    }
+                diag.iis.members.append(
+                    IISMember(role=role.lower(), symbol=symbol, detail=detail)
                 )
 
+
+def _uppercase(content: bytes | mmap.mmap) -> bytes | bytearray:
+    """Return an uppercased copy of ``content``.
+
+    A memory map is uppercased ``LISTING_CHUNK_SIZE`` bytes at a time into a
+    preallocated buffer, so no full-size intermediate copy is made.
+    """
+    if isinstance(content, bytes):
+        return content.upper()
+    upper = bytearray(len(content))
+    for start in range(0, len(upper), LISTING_CHUNK_SIZE):
+        end = start + LISTING_CHUNK_SIZE
+        upper[start:end] = content[start:end].upper()
+    return upper
+
+
+def parse_gams_diagnostics(
+    content: bytes | memoryview | mmap.mmap | str,
+) -> Diagnostics:
+    """Parse GAMS listing file content into a ``Diagnostics`` structure.
+
+    The listing is scanned in bytes mode; a memory-mapped file can be passed
+    directly. ``str`` input is accepted for convenience and encoded first.
+
+    Memory: besides ``content`` itself (a memory map is not copied), parsing
+    holds one uppercased copy of the listing, i.e. about the listing's size,
+    plus one ``LISTING_CHUNK_SIZE`` buffer while that copy is built.
+    """
+    if isinstance(content, str):
+        content = content.encode()
+    elif isinstance(content, memoryview):
+        content = content.tobytes()
+
+    diag = Diagnostics()
+
+    # Uppercased copy for the sentinel gates and the flag regexes
+    upper = _uppercase(content)
+
+    # Parse compilation errors
+    error_matches = []
+    # find() rather than "in": mmap objects do not support substring tests
+    if content.find(b"ERROR") != -1:
+        error_matches = _first_n(ERROR_LINE_RE, content, MAX_LISTING_MESSAGES)
+    if error_matches:
+        diag.compilation.ok = False
+        diag.compilation.errors = error_matches
+        diag.messages.errors.extend(error_matches)
+
+    # Parse warnings
+    warning_matches = []
+    if content.find(b"WARNING") != -1:
+        warning_matches = _first_n(WARNING_LINE_RE, content, MAX_LISTING_MESSAGES)
+    if warning_matches:
+        diag.compilation.warnings = warning_matches
+        diag.messages.warnings.extend(warning_matches)
+
+    # Detect problem flags from content
+    flags = diag.flags
+    for flag, sentinel, pattern in FLAG_SCANS:
+        setattr(flags, flag, _gated_search(pattern, sentinel, upper))
+    for flag in _status_word_flags(upper):
+        setattr(flags, flag, True)
+
+    if flags.syntax_error:
+        diag.compilation.ok = False
+
+    # A listing whose compilation failed and that has no solve summary never
+    # reached the solver, so the status, objective and IIS scans are skipped
+    if diag.compilation.ok or content.find(MODEL_STATUS_MARKER) != -1:
+        _parse_solve_summary(diag, content, upper)
+        _parse_iis(diag, content, upper)
+
+    _summarize(diag)
+
     return diag
 
 
+def parse_gams_listing(content: bytes | memoryview | mmap.mmap | str) -> dict[str, Any]:
+    """Parse GAMS listing file content into structured diagnostics.
+
+    Returns comprehensive diagnostic structure for AI agent consumption, as
+    the nested-dict form of ``parse_gams_diagnostics``.
+    """
+    return parse_gams_diagnostics(content).to_dict()
+
+
+def _read_listing_excerpt(f: BinaryIO) -> bytes:
+    """Read the parts of a large listing that ``parse_gams_listing`` inspects.
+
+    The file is read in line-aligned chunks of ``LISTING_CHUNK_SIZE`` bytes.
+    Retained are the first chunk matching each flag pattern or raising each
+    infeasible/unbounded flag, chunks with error/warning lines until enough
+    messages are collected, the conflict refiner chunk and the one after it,
+    the first chunk holding a solve summary marker together with its
+    neighbours, and the final two chunks. Memory therefore stays bounded by a
+    handful of chunks regardless of the listing size.
+    """
+    kept: dict[int, bytes] = {}
+    tail: deque[tuple[int, bytes]] = deque(maxlen=2)
+    pending_flags = {(sentinel, pattern) for _, sentinel, pattern in FLAG_SCANS}
+    pending_status_words = set(STATUS_WORD_FLAGS)
+    message_counts = {ERROR_LINE_RE: 0, WARNING_LINE_RE: 0}
+    message_literals = {ERROR_LINE_RE: b"ERROR", WARNING_LINE_RE: b"WARNING"}
+    follow_conflict = follow_summary = summary_seen = False
+
+    chunks = iter(lambda: f.read(LISTING_CHUNK_SIZE) + f.readline(), b"")
+    for index, chunk in enumerate(chunks):
+        upper = chunk.upper()
+        keep = follow_conflict or follow_summary
+        follow_conflict = CONFLICT_STATUS_SENTINEL in upper
+        follow_summary = False
+        keep = keep or follow_conflict
+
+        # A flag is settled only once its pattern matches: the sentinel alone
+        # also occurs in harmless text (e.g. LICENS in the Licensee header)
+        hits = {
+            (sentinel, pattern)
+            for sentinel, pattern in pending_flags
+            if sentinel in upper and pattern.search(upper)
+        }
+        if hits:
+            pending_flags -= hits
+            keep = True
+        if pending_status_words:
+            raised = _status_word_flags(upper) & pending_status_words
+            if raised:
+                pending_status_words -= raised
+                keep = True
+        for pattern, count in message_counts.items():
+            if count < MAX_LISTING_MESSAGES and message_literals[pattern] in chunk:
+                found = sum(
+                    1 for _ in islice(pattern.finditer(chunk), MAX_LISTING_MESSAGES)
+                )
+                if found:
+                    message_counts[pattern] = count + found
+                    keep = True
+
+        # The first solve summary is reported. Its block may straddle chunk
+        # boundaries, so the chunks either side of the first marker are
+        # retained as well (the one before is still in ``tail``)
+        if not summary_seen and any(
+            marker in chunk for marker in SOLVE_SUMMARY_MARKERS
+        ):
+            summary_seen = follow_summary = keep = True
+            if tail:
+                kept.setdefault(*tail[-1])
+
+        if keep:
+            kept[index] = chunk
+        tail.append((index, chunk))
+
+    for index, chunk in tail:
+        kept.setdefault(index, chunk)
+    return b"".join(kept[index] for index in sorted(kept))
+
+
 def parse_lst_file(lst_path: Path) -> dict:
     """Parse GAMS listing file for model/solve status.
 
@@ -442,32 +944,61 @@ def parse_lst_file(lst_path: Path) -> dict:
     if not lst_path.exists():
         return result
 
-    content = lst_path.read_text(errors="replace")
-
-    # Get full diagnostics
-    diag = parse_gams_listing(content)
-    result["diagnostics"] = diag
+    # Map the listing rather than reading it into a str: the regexes run in
+    # bytes mode and only the small captured groups get decoded. Very large
+    # listings are streamed so that only the relevant excerpts are held.
+    with open(lst_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            diag = parse_gams_diagnostics(b"")
+        elif size >= LISTING_STREAM_THRESHOLD:
+            diag = parse_gams_diagnostics(_read_listing_excerpt(f))
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                diag = parse_gams_diagnostics(content)
+    result["diagnostics"] = diag.to_dict()
 
     # Extract legacy fields from diagnostics
-    model_status = diag["execution"]["model_status"]
-    if model_status["text"]:
-        result["model_status"] = model_status["text"]
-    elif model_status["code"]:
-        result["model_status"] = str(model_status["code"])
-
-    solve_status = diag["execution"]["solve_status"]
-    if solve_status["text"]:
-        result["solve_status"] = solve_status["text"]
-    elif solve_status["code"]:
-        result["solve_status"] = str(solve_status["code"])
-
-    result["objective"] = diag["execution"]["objective"]["value"]
-    result["errors"] = diag["compilation"]["errors"][:10]
-    result["warnings"] = diag["compilation"]["warnings"][:10]
+    model_status = diag.execution.model_status
+    if model_status.text:
+        result["model_status"] = model_status.text
+    elif model_status.code:
+        result["model_status"] = str(model_status.code)
+
+    solve_status = diag.execution.solve_status
+    if solve_status.text:
+        result["solve_status"] = solve_status.text
+    elif solve_status.code:
+        result["solve_status"] = str(solve_status.code)
+
+    result["objective"] = diag.execution.objective.value
+    result["errors"] = diag.compilation.errors[:10]
+    result["warnings"] = diag.compilation.warnings[:10]
 
     return result
 
 
+def _collect_outputs(work_path: Path, case: str) -> tuple[Path | None, list[Path]]:
+    """Find the listing and GDX files in a work dir with one directory scan.
+
+    Prefers ``<case>.lst`` and falls back to any other ``.lst`` file.
+    """
+    case_lst = f"{case}.lst"
+    lst_file: Path | None = None
+    fallback_lst: Path | None = None
+    gdx_files: list[Path] = []
+    with os.scandir(work_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name == case_lst:
+                lst_file = Path(entry.path)
+            elif name.endswith(".gdx"):
+                gdx_files.append(Path(entry.path))
+            elif fallback_lst is None and name.endswith(".lst"):
+                fallback_lst = Path(entry.path)
+    return lst_file or fallback_lst, gdx_files
+
+
 def run_times(
     dd_dir: Path,
     case: str = "scenario",
@@ -505,25 +1036,17 @@ def run_times(
                 errors=["TIMES source not found. Set TIMES_SRC env var or --times-src"],
             )
 
-    work_path = setup_work_dir(dd_dir, case, work_dir, times_src)
+    # Only a temp work dir that will be removed may share DD files by hard link
+    throwaway = not keep_workdir and work_dir is None
+    work_path = setup_work_dir(
+        dd_dir, case, work_dir, times_src, link_inputs=throwaway
+    )
 
     # Generate solver option file with IIS enabled for CPLEX
     if solver.upper() == "CPLEX":
         cplex_opt = work_path / "cplex.opt"
         if not cplex_opt.exists():
-            cplex_opt.write_text(
-                "\n".join(
-                    [
-                        "* Automatically generated by veda_run_times",
-                        "* Enable conflict refiner / IIS when model is infeasible",
-                        "iis 1",
-                        "conflictdisplay 2",
-                        "names 1",
-                        "rerun auto",
-                        "",
-                    ]
-                )
-            )
+            cplex_opt.write_bytes(CPLEX_OPT_CONTENT)
 
     cmd = [
         gams_binary,
@@ -540,14 +1063,9 @@ def run_times(
         cmd,
         cwd=work_path,
         capture_output=True,
-        text=True,
     )
 
-    lst_file = work_path / f"{case}.lst"
-    if not lst_file.exists():
-        lst_file = next(work_path.glob("*.lst"), None)
-
-    gdx_files = list(work_path.glob("*.gdx"))
+    lst_file, gdx_files = _collect_outputs(work_path, case)
 
     lst_info = parse_lst_file(lst_file) if lst_file else {}
     diagnostics = lst_info.get("diagnostics")
@@ -556,14 +1074,9 @@ def run_times(
     if diagnostics:
         success = proc.returncode == 0 and diagnostics["summary"]["ok"]
     else:
-        success = proc.returncode == 0 and lst_info.get("model_status") in (
-            None,
-            "1",
-            "OPTIMAL",
-            "2",
-            "LOCALLY OPTIMAL",
-            "8",
-            "INTEGER SOLUTION",
+        success = (
+            proc.returncode == 0
+            and lst_info.get("model_status") in LEGACY_OK_MODEL_STATUSES
         )
 
     result = RunResult(
@@ -584,8 +1097,42 @@ def run_times(
         stderr=proc.stderr,
     )
 
-    if not keep_workdir and success and work_dir is None:
-        shutil.rmtree(work_path, ignore_errors=True)
-        result.work_dir = Path("(cleaned up)")
+    if throwaway:
+        if success:
+            shutil.rmtree(work_path, ignore_errors=True)
+            result.work_dir = Path("(cleaned up)")
+        else:
+            # Failed runs keep their work dir for inspection: replace the
+            # links with copies so edits there cannot reach the DD sources or
+            # the scaffold
+            for staged in (work_path / "model").glob("*.dd"):
+                _stage_file(dd_dir / staged.name, staged)
+            scaffold = get_scaffold_dir()
+            for scaffold_file in SCAFFOLD_FILES:
+                staged = work_path / scaffold_file
+                if staged.is_symlink():
+                    _stage_file(scaffold / scaffold_file, staged)
 
     return result
+
+
+def run_times_batch(
+    jobs: list[dict[str, Any]],
+    max_workers: int | None = None,
+) -> list[RunResult]:
+    """Run several TIMES models in parallel worker processes.
+
+    Each job is a dict of keyword arguments for ``run_times``. GAMS runs and
+    listing parsing for different jobs overlap, so scenario sweeps scale with
+    the number of cores (or GAMS license seats).
+
+    Args:
+        jobs: Keyword arguments for each ``run_times`` call
+        max_workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        RunResult for each job, in the same order as ``jobs``
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(run_times, **job) for job in jobs]
+        return [future.result() for future in futures]
@@ -1,22 +1,43 @@
 """VedaLang compiler - transforms VedaLang source to TableIR."""
 
-from .compiler import (
-    SemanticValidationError,
-    compile_vedalang_to_tableir,
-    load_vedalang,
-    validate_cross_references,
-    validate_vedalang,
-)
-from .table_schemas import (
-    TableValidationError,
-    VedaFieldSchema,
-    VedaTableLayout,
-    VedaTableSchema,
-    get_all_schemas,
-    validate_tableir,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .compiler import (
+        SemanticValidationError,
+        compile_vedalang_to_tableir,
+        load_vedalang,
+        validate_cross_references,
+        validate_vedalang,
+    )
+    from .table_schemas import (
+        TableValidationError,
+        VedaFieldSchema,
+        VedaTableLayout,
+        VedaTableSchema,
+        get_all_schemas,
+        validate_tableir,
+    )
 
-__all__ = [
+# Public name -> submodule defining it. Submodules are imported on first
+# access (PEP 562), so importing the package (e.g. for the CLI's --help)
+# does not pull in jsonschema and yaml.
+_EXPORTS = {
+    "SemanticValidationError": ".compiler",
+    "compile_vedalang_to_tableir": ".compiler",
+    "load_vedalang": ".compiler",
+    "validate_cross_references": ".compiler",
+    "validate_vedalang": ".compiler",
+    "TableValidationError": ".table_schemas",
+    "VedaFieldSchema": ".table_schemas",
+    "VedaTableLayout": ".table_schemas",
+    "VedaTableSchema": ".table_schemas",
+    "get_all_schemas": ".table_schemas",
+    "validate_tableir": ".table_schemas",
+}
+
+__all__ = (
     "SemanticValidationError",
     "TableValidationError",
     "VedaFieldSchema",
@@ -28,4 +49,19 @@ __all__ = [
     "validate_cross_references",
     "validate_tableir",
     "validate_vedalang",
-]
+)
+
+
+def __getattr__(name: str) -> object:
+    """Import the submodule defining a public name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names, including those not imported yet."""
+    return sorted({*globals(), *__all__})
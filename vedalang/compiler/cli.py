@@ -4,11 +4,6 @@ import argparse
 import sys
 from pathlib import Path
 
-import jsonschema
-import yaml
-
-from .compiler import compile_vedalang_to_tableir, load_vedalang
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -48,6 +43,12 @@ def main():
 
 def run_compile(args):
     """Run the compile command."""
+    # Imported here so that argument parsing (e.g. --help) stays cheap
+    import jsonschema
+    import yaml
+
+    from .compiler import YAML_DUMPER, compile_vedalang_to_tableir, load_vedalang
+
     verbose = args.verbose
 
     if not args.input.exists():
@@ -74,7 +75,13 @@ def run_compile(args):
         if args.tableir:
             args.tableir.parent.mkdir(parents=True, exist_ok=True)
             with open(args.tableir, "w") as f:
-                yaml.dump(tableir, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    tableir,
+                    f,
+                    Dumper=YAML_DUMPER,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
             print(f"Wrote TableIR to {args.tableir}")
 
         if args.out:
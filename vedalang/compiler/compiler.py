@@ -1,18 +1,44 @@
 """VedaLang to TableIR compiler."""
 
+import copy
+import functools
 import json
+import sys
+from bisect import bisect_left, bisect_right
 from difflib import get_close_matches
+from itertools import product
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
 
 import jsonschema
 import yaml
 
+# Optional code-generated validator for the VedaLang (draft-07) schema
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Prefer the LibYAML-backed classes; the fallback is resolved once at import.
+# YAML_DUMPER is used by the CLI when writing TableIR.
+try:
+    from yaml import CSafeDumper as YAML_DUMPER  # noqa: F401
+    from yaml import CSafeLoader as YAML_LOADER
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeDumper as YAML_DUMPER  # noqa: F401
+    from yaml import SafeLoader as YAML_LOADER
+
 SCHEMA_DIR = Path(__file__).parent.parent / "schema"
 
 # Unit categories for semantic validation
-ENERGY_UNITS = {"PJ", "TJ", "GJ", "MWh", "GWh", "TWh", "MTOE", "KTOE"}
-POWER_UNITS = {"GW", "MW", "kW", "TW"}
-MASS_UNITS = {"Mt", "kt", "t", "Gt"}
+ENERGY_UNITS = frozenset({"PJ", "TJ", "GJ", "MWh", "GWh", "TWh", "MTOE", "KTOE"})
+POWER_UNITS = frozenset({"GW", "MW", "kW", "TW"})
+MASS_UNITS = frozenset({"Mt", "kt", "t", "Gt"})
+
+# Unit lists quoted in unit warnings
+_ENERGY_UNITS_SORTED_STR = ", ".join(sorted(ENERGY_UNITS))
+_POWER_UNITS_SORTED_STR = ", ".join(sorted(POWER_UNITS))
 
 # Default units by commodity type
 DEFAULT_UNITS = {
@@ -40,6 +66,31 @@ ATTR_TO_COLUMN = {
     "availability_factor": "ncap_af",  # NCAP_AF canonical (aliases: cf, utilization)
 }
 
+# Map VedaLang bound fields to VEDA bound columns
+BOUND_COLUMNS = {
+    "activity_bound": "act_bnd",
+    "cap_bound": "cap_bnd",
+    "ncap_bound": "ncap_bnd",
+}
+
+# Map VedaLang limit keys to VEDA limtype values
+LIMTYPES = {
+    "up": "UP",
+    "lo": "LO",
+    "fx": "FX",
+}
+
+# Map VedaLang commodity types to VEDA Csets
+COMMODITY_TYPE_CSETS = {
+    "energy": "NRG",
+    "material": "MAT",
+    "emission": "ENV",
+    "demand": "DEM",
+}
+
+# Process cost attributes merged into ~FI_T rows (in emission order)
+COST_ATTRS = ("invcost", "fixom", "varom", "life", "cost")
+
 # Interpolation mode to VEDA code mapping
 INTERPOLATION_CODES = {
     "none": -1,
@@ -56,6 +107,11 @@ def _is_time_varying(value) -> bool:
     return isinstance(value, dict) and "values" in value
 
 
+def _intern_name(value):
+    """Intern a name string; non-string names (e.g. YAML ints) pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def _normalize_process_flows(process: dict) -> dict:
     """
     Normalize process input/output shorthand to standard array format.
@@ -68,8 +124,14 @@ def _normalize_process_flows(process: dict) -> dict:
         process: Process definition (may have shorthand or standard format)
 
     Returns:
-        Process with normalized inputs/outputs arrays
+        Process with normalized inputs/outputs arrays. Processes without
+        shorthand are returned as-is (the result aliases the input), so
+        callers must treat the result as read-only.
     """
+    # Copy only when there is shorthand to rewrite
+    if "input" not in process and "output" not in process:
+        return process
+
     result = process.copy()
 
     # Normalize single input string to array
@@ -85,11 +147,6 @@ def _normalize_process_flows(process: dict) -> dict:
     return result
 
 
-def _get_default_unit(commodity_type: str) -> str:
-    """Get default unit for a commodity type."""
-    return DEFAULT_UNITS.get(commodity_type, "PJ")
-
-
 def _get_scalar_value(value):
     """Get scalar value from scalar or time-varying spec (returns None for latter)."""
     if _is_time_varying(value):
@@ -166,7 +223,25 @@ class SemanticValidationError(Exception):
         return "\n".join(parts)
 
 
-def validate_cross_references(model: dict) -> tuple[list[str], list[str]]:
+def _suggestion_hint(name: str, candidates: frozenset[str]) -> str:
+    """Return a "Did you mean" hint for an unknown name, or an empty string.
+
+    Only runs on the error path, so it is not cached. get_close_matches
+    already applies the real_quick_ratio/quick_ratio prefilters before
+    computing the full ratio.
+    """
+    if not candidates:
+        return ""
+    matches = get_close_matches(name, candidates, n=1, cutoff=0.6)
+    if matches:
+        return f" Did you mean '{matches[0]}'?"
+    return ""
+
+
+def validate_cross_references(
+    model: dict,
+    normalized_processes: list[dict] | None = None,
+) -> tuple[list[str], list[str]]:
     """
     Validate semantic cross-references in the model.
 
@@ -175,6 +250,8 @@ def validate_cross_references(model: dict) -> tuple[list[str], list[str]]:
 
     Args:
         model: The model dictionary from VedaLang source
+        normalized_processes: model["processes"] already passed through
+            _normalize_process_flows, to avoid normalizing them again
 
     Returns:
         Tuple of (errors, warnings)
@@ -182,34 +259,34 @@ def validate_cross_references(model: dict) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
 
+    raw_processes = model.get("processes") or []
+    raw_constraints = model.get("constraints") or []
+    raw_trade_links = model.get("trade_links") or []
+    raw_scenarios = model.get("scenarios") or []
+
+    # Nothing that references other entities: no lookup sets needed
+    if not (raw_processes or raw_constraints or raw_trade_links or raw_scenarios):
+        return errors, warnings
+
     # Build lookup sets
     commodities = {c["name"]: c for c in model.get("commodities", [])}
-    commodity_names = set(commodities.keys())
-    processes = {p["name"] for p in model.get("processes", [])}
-    regions = set(model.get("regions", []))
+    commodity_names = frozenset(commodities)
+    processes = frozenset(p["name"] for p in raw_processes)
+    regions = frozenset(model.get("regions", []))
 
     def suggest_commodity(name: str) -> str:
-        matches = get_close_matches(name, commodity_names, n=1, cutoff=0.6)
-        if matches:
-            return f" Did you mean '{matches[0]}'?"
-        return ""
+        return _suggestion_hint(name, commodity_names)
 
     def suggest_process(name: str) -> str:
-        matches = get_close_matches(name, processes, n=1, cutoff=0.6)
-        if matches:
-            return f" Did you mean '{matches[0]}'?"
-        return ""
+        return _suggestion_hint(name, processes)
 
     def suggest_region(name: str) -> str:
-        matches = get_close_matches(name, regions, n=1, cutoff=0.6)
-        if matches:
-            return f" Did you mean '{matches[0]}'?"
-        return ""
+        return _suggestion_hint(name, regions)
 
-    # Validate process references
-    for raw_process in model.get("processes", []):
-        # Normalize shorthand syntax before validation
-        process = _normalize_process_flows(raw_process)
+    # Validate process references (shorthand syntax normalized first)
+    if normalized_processes is None:
+        normalized_processes = [_normalize_process_flows(p) for p in raw_processes]
+    for process in normalized_processes:
         proc_name = process["name"]
 
         # Check input commodity references
@@ -238,7 +315,7 @@ def validate_cross_references(model: dict) -> tuple[list[str], list[str]]:
             warnings.append(
                 f"Process '{proc_name}' has activity_unit '{activity_unit}' "
                 f"which is not a recognized energy unit. "
-                f"Expected one of: {', '.join(sorted(ENERGY_UNITS))}"
+                f"Expected one of: {_ENERGY_UNITS_SORTED_STR}"
             )
 
         capacity_unit = process.get("capacity_unit")
@@ -246,11 +323,11 @@ def validate_cross_references(model: dict) -> tuple[list[str], list[str]]:
             warnings.append(
                 f"Process '{proc_name}' has capacity_unit '{capacity_unit}' "
                 f"which is not a recognized power unit. "
-                f"Expected one of: {', '.join(sorted(POWER_UNITS))}"
+                f"Expected one of: {_POWER_UNITS_SORTED_STR}"
             )
 
     # Validate constraint references
-    for constraint in model.get("constraints", []):
+    for constraint in raw_constraints:
         constraint_name = constraint["name"]
 
         # Check commodity reference
@@ -271,7 +348,7 @@ def validate_cross_references(model: dict) -> tuple[list[str], list[str]]:
                 )
 
     # Validate trade link references
-    for i, link in enumerate(model.get("trade_links", [])):
+    for i, link in enumerate(raw_trade_links):
         origin = link["origin"]
         destination = link["destination"]
         commodity = link["commodity"]
@@ -295,7 +372,7 @@ def validate_cross_references(model: dict) -> tuple[list[str], list[str]]:
             )
 
     # Validate scenario references
-    for scenario in model.get("scenarios", []):
+    for scenario in raw_scenarios:
         scenario_name = scenario["name"]
         scenario_type = scenario.get("type")
         commodity = scenario.get("commodity")
@@ -331,78 +408,165 @@ def validate_cross_references(model: dict) -> tuple[list[str], list[str]]:
     return errors, warnings
 
 
+@functools.cache
 def load_vedalang_schema() -> dict:
-    """Load the VedaLang JSON schema."""
-    with open(SCHEMA_DIR / "vedalang.schema.json") as f:
-        return json.load(f)
+    """Load the VedaLang JSON schema (read once; treat the result as read-only)."""
+    return json.loads((SCHEMA_DIR / "vedalang.schema.json").read_bytes())
 
 
+@functools.cache
 def load_tableir_schema() -> dict:
-    """Load the TableIR JSON schema."""
-    with open(SCHEMA_DIR / "tableir.schema.json") as f:
-        return json.load(f)
+    """Load the TableIR JSON schema (read once; treat the result as read-only)."""
+    return json.loads((SCHEMA_DIR / "tableir.schema.json").read_bytes())
 
 
-def validate_vedalang(source: dict) -> None:
-    """Validate VedaLang source against schema."""
-    schema = load_vedalang_schema()
-    jsonschema.validate(source, schema)
+def _build_validator(schema: dict):
+    """Check a schema and build a validator for its declared draft."""
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+@functools.cache
+def _vedalang_validator():
+    return _build_validator(load_vedalang_schema())
+
+
+@functools.cache
+def _tableir_validator():
+    return _build_validator(load_tableir_schema())
+
+
+@functools.cache
+def _vedalang_fast_validator():
+    """Compile the VedaLang schema with fastjsonschema, if it is installed.
+
+    Only used as a fast accept path: defaults and formats are disabled so it
+    accepts exactly what jsonschema does, and any rejection is re-validated
+    with jsonschema to raise the usual ValidationError. The TableIR schema
+    is draft 2020-12, which fastjsonschema does not support.
+    """
+    if fastjsonschema is None:
+        return None
+    try:
+        # fastjsonschema rewrites $refs in place, so give it a private copy
+        return fastjsonschema.compile(
+            copy.deepcopy(load_vedalang_schema()),
+            use_default=False,
+            use_formats=False,
+        )
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+def _raise_best_match(validator, instance) -> None:
+    """Raise the same error jsonschema.validate() would for this instance."""
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
 
 
-def compile_vedalang_to_tableir(source: dict, validate: bool = True) -> dict:
+def validate_vedalang(source: dict) -> None:
+    """Validate VedaLang source against schema."""
+    fast_validate = _vedalang_fast_validator()
+    if fast_validate is not None:
+        try:
+            fast_validate(source)
+            return
+        except fastjsonschema.JsonSchemaValueException:
+            pass  # Report the error through jsonschema below
+    _raise_best_match(_vedalang_validator(), source)
+
+
+def compile_vedalang_to_tableir(
+    source: dict,
+    validate: bool | None = None,
+    *,
+    validate_input: bool = True,
+    validate_output: bool = False,
+) -> dict:
     """
     Transform VedaLang source to TableIR structure.
 
     Args:
         source: VedaLang dictionary (parsed from .veda.yaml)
-        validate: Whether to validate input/output against schemas and semantics
+        validate: Legacy switch; when given, overrides both validate_input
+            and validate_output
+        validate_input: Validate the source against the VedaLang schema and
+            check semantic cross-references
+        validate_output: Validate the emitted TableIR against the TableIR and
+            VEDA table schemas. The compiler is deterministic, so this is
+            only needed when working on the compiler itself.
 
     Returns:
         TableIR dictionary ready for veda_emit_excel
 
     Raises:
-        jsonschema.ValidationError: If source doesn't match VedaLang schema
+        jsonschema.ValidationError: If source (or, with validate_output,
+            the TableIR) doesn't match its schema
         SemanticValidationError: If cross-references are invalid
+        TableValidationError: If validate_output finds non-canonical columns
     """
-    if validate:
+    if validate is not None:
+        validate_input = validate_output = validate
+
+    if validate_input:
         validate_vedalang(source)
 
     model = source["model"]
 
+    # Normalize shorthand input/output syntax once for validation and emission
+    processes = [_normalize_process_flows(p) for p in model.get("processes", [])]
+
     # Semantic cross-reference validation (before any emission)
-    if validate:
-        errors, warnings = validate_cross_references(model)
+    if validate_input:
+        errors, warnings = validate_cross_references(model, processes)
         if errors:
             raise SemanticValidationError(errors, warnings)
 
     # Get regions from model
     regions = model.get("regions", ["REG1"])
-    default_region = ",".join(regions)  # For multi-region models
+    # Identifiers repeated across many rows are interned so every row shares
+    # one string object per name
+    default_region = sys.intern(",".join(regions))  # For multi-region models
+
+    # Derive model years once for all time-series expansion
+    model_years = _get_model_years(model)
+
+    # Commodities feed both ~FI_COMM and the trade link units
+    commodities = model.get("commodities", [])
 
     # Build commodity table (~FI_COMM)
     # Use lowercase column names for xl2times compatibility
+    # Commodity type -> Csets (default NRG) and default unit (default PJ),
+    # bound once for the loop
+    csets_for_type = COMMODITY_TYPE_CSETS.get
+    unit_for_type = DEFAULT_UNITS.get
     comm_rows = []
-    for commodity in model.get("commodities", []):
+    for commodity in commodities:
         comm_type = commodity.get("type", "energy")
         # Use explicit unit or default based on commodity type
-        unit = commodity.get("unit") or _get_default_unit(comm_type)
+        unit = commodity.get("unit") or unit_for_type(comm_type, "PJ")
         comm_rows.append({
             "region": default_region,
-            "csets": _commodity_type_to_csets(comm_type),
-            "commodity": commodity["name"],
+            "csets": csets_for_type(comm_type, "NRG"),
+            "commodity": _intern_name(commodity["name"]),
             "unit": unit,
         })
 
-    # Build process table (~FI_PROCESS)
+    # Build process table (~FI_PROCESS) and topology table (~FI_T) in one pass
     # Use lowercase column names for xl2times compatibility
     # primary_commodity_group is REQUIRED in schema - use directly, no inference
     process_rows = []
-    for raw_process in model.get("processes", []):
-        # Normalize shorthand input/output syntax
-        process = _normalize_process_flows(raw_process)
+    topology_rows = []
+    attr_to_column = ATTR_TO_COLUMN  # Local lookups in the per-process loop
+    is_time_varying = _is_time_varying
+    intern = _intern_name
+    for process in processes:
+        process_name = intern(process["name"])
         process_rows.append({
             "region": default_region,
-            "process": process["name"],
+            "process": process_name,
             "description": process.get("description", ""),
             "sets": ",".join(process.get("sets", [])),
             "tact": process.get("activity_unit", "PJ"),
@@ -410,12 +574,7 @@ def compile_vedalang_to_tableir(source: dict, validate: bool = True) -> dict:
             "primarycg": process["primary_commodity_group"],
         })
 
-    # Build topology table (~FI_T) for inputs/outputs
-    # Use lowercase column names for xl2times compatibility
-    topology_rows = []
-    for raw_process in model.get("processes", []):
-        # Normalize shorthand input/output syntax
-        process = _normalize_process_flows(raw_process)
+        # Topology rows for inputs/outputs
         inputs = process.get("inputs", [])
         outputs = process.get("outputs", [])
 
@@ -423,39 +582,36 @@ def compile_vedalang_to_tableir(source: dict, validate: bool = True) -> dict:
         # Keys in cost_params use CANONICAL column names from ATTR_TO_COLUMN
         cost_params = {}  # Scalar values to merge into rows (canonical column names)
         time_varying_attrs = []  # (attr_name, value) tuples for separate rows
-        for attr in ["invcost", "fixom", "varom", "life", "cost"]:
+        for attr in COST_ATTRS:
             if attr in process:
                 val = process[attr]
-                # Map VedaLang attr name to canonical column name
-                column = ATTR_TO_COLUMN.get(attr, attr)
-                if _is_time_varying(val):
+                if is_time_varying(val):
                     time_varying_attrs.append((attr, val))
                 else:
-                    cost_params[column] = val
+                    # Map VedaLang attr name to canonical column name
+                    cost_params[attr_to_column.get(attr, attr)] = val
+
+        # Every ~FI_T row for this process starts from the same region/process
+        # key; copying a template is cheaper than building each dict literal
+        row_key = {"region": default_region, "process": process_name}
 
         # Add input flows
         for inp in inputs:
-            row = {
-                "region": default_region,
-                "process": process["name"],
-                "commodity-in": inp["commodity"],
-            }
+            row = row_key.copy()
+            row["commodity-in"] = intern(inp["commodity"])
             if "share" in inp:
                 row["share-i"] = inp["share"]
             topology_rows.append(row)
 
         # Add output flows - merge cost params into first output row if no eff
         for i, out in enumerate(outputs):
-            row = {
-                "region": default_region,
-                "process": process["name"],
-                "commodity-out": out["commodity"],
-            }
+            row = row_key.copy()
+            row["commodity-out"] = intern(out["commodity"])
             if "share" in out:
                 row["share-o"] = out["share"]
             # Merge cost params into first output row if no efficiency specified
             if i == 0 and "efficiency" not in process and cost_params:
-                row.update(cost_params)
+                row |= cost_params
                 cost_params = {}  # Clear so we don't add again
             topology_rows.append(row)
 
@@ -465,64 +621,41 @@ def compile_vedalang_to_tableir(source: dict, validate: bool = True) -> dict:
         # Add efficiency row with cost and bound parameters if specified
         if "efficiency" in process:
             eff_val = process["efficiency"]
-            if _is_time_varying(eff_val):
+            if is_time_varying(eff_val):
                 # Time-varying efficiency - add to time_varying_attrs
                 time_varying_attrs.append(("efficiency", eff_val))
                 # Still emit a base row with scalar cost params if any
                 if cost_params:
-                    row = {
-                        "region": default_region,
-                        "process": process["name"],
-                    }
-                    row.update(cost_params)
+                    row = row_key | cost_params
                     if bound_params:
-                        first_bound = bound_params.pop(0)
-                        row.update(first_bound)
+                        row |= bound_params.pop(0)
                     topology_rows.append(row)
             else:
                 # Scalar efficiency
-                row = {
-                    "region": default_region,
-                    "process": process["name"],
-                    "eff": eff_val,
-                }
-                row.update(cost_params)
+                row = row_key.copy()
+                row["eff"] = eff_val
+                row |= cost_params
                 # Merge first bound into efficiency row if present
                 if bound_params:
-                    first_bound = bound_params.pop(0)
-                    row.update(first_bound)
+                    row |= bound_params.pop(0)
                 topology_rows.append(row)
 
+        # Rows below need at least one commodity reference for xl2times
+        # (Comm-IN, Comm-OUT, EFF, or Value); use the first output commodity
+        first_output = intern(outputs[0]["commodity"]) if outputs else None
+        if first_output:
+            row_key["commodity-out"] = first_output
+
         # Emit remaining bounds merged with commodity-out references
-        # xl2times requires rows to have Comm-IN, Comm-OUT, EFF, or Value
         for bound_param in bound_params:
-            # Find first output commodity for this process
-            first_output = outputs[0]["commodity"] if outputs else None
-            row = {
-                "region": default_region,
-                "process": process["name"],
-            }
-            if first_output:
-                row["commodity-out"] = first_output
-            row.update(bound_param)
-            topology_rows.append(row)
+            topology_rows.append(row_key | bound_param)
 
         # Emit time-varying attributes as separate year-indexed rows
-        # xl2times requires at least one commodity reference per row
-        first_output = outputs[0]["commodity"] if outputs else None
         for attr_name, attr_value in time_varying_attrs:
-            base_row = {
-                "region": default_region,
-                "process": process["name"],
-            }
-            if first_output:
-                base_row["commodity-out"] = first_output
-            expanded_rows = _expand_time_varying_attr(attr_name, attr_value, base_row)
+            expanded_rows = _expand_time_varying_attr(attr_name, attr_value, row_key)
             topology_rows.extend(expanded_rows)
 
     # Build system settings tables
-    regions = model.get("regions", ["REG1"])
-
     # ~BOOKREGIONS_MAP - maps book regions to internal regions
     # Use a single bookname for all regions to ensure all are treated as internal
     # The bookname must match the VT_{bookname}_* file pattern
@@ -549,9 +682,6 @@ def compile_vedalang_to_tableir(source: dict, validate: bool = True) -> dict:
     # ~CURRENCIES - default currency
     currencies_rows = [{"currency": "USD"}]
 
-    # Derive model years for time-series expansion
-    model_years = _get_model_years(model)
-
     # Build scenario files (~TFM_DINS-AT tables)
     # ARCHITECTURE/SCENARIO SEPARATION:
     # - Scenario data (demand projections, commodity prices) goes to Scen_* files
@@ -559,17 +689,10 @@ def compile_vedalang_to_tableir(source: dict, validate: bool = True) -> dict:
     # - Uses ~TFM_DINS-AT for VedaOnline compatibility
     scenario_files = []
     for scenario in model.get("scenarios", []):
-        scenario_type = scenario.get("type")
-        scenario_rows = []
-
-        if scenario_type == "commodity_price":
-            scenario_rows = _compile_commodity_price_scenario(
-                scenario, regions, model_years
-            )
-        elif scenario_type == "demand_projection":
-            scenario_rows = _compile_demand_projection_scenario(
-                scenario, regions, model_years
-            )
+        compile_scenario = _SCENARIO_COMPILERS.get(scenario.get("type"))
+        if compile_scenario is None:
+            continue
+        scenario_rows = compile_scenario(scenario, regions, model_years)
 
         if scenario_rows:
             scenario_file = {
@@ -624,7 +747,7 @@ def compile_vedalang_to_tableir(source: dict, validate: bool = True) -> dict:
     # Compile trade links if present - returns files, process declarations, and topology
     trade_link_files, trade_process_rows, trade_topology_rows = _compile_trade_links(
         model.get("trade_links", []),
-        model.get("commodities", []),
+        commodities,
     )
 
     # Merge trade process declarations into main process/topology rows
@@ -665,9 +788,8 @@ def compile_vedalang_to_tableir(source: dict, validate: bool = True) -> dict:
         ]
     }
 
-    if validate:
-        tableir_schema = load_tableir_schema()
-        jsonschema.validate(tableir, tableir_schema)
+    if validate_output:
+        _raise_best_match(_tableir_validator(), tableir)
 
         # Validate against VEDA table schemas (canonical column names only)
         from .table_schemas import TableValidationError, validate_tableir
@@ -697,47 +819,23 @@ def _collect_bound_params(process: dict) -> list[dict]:
     """
     params = []
 
-    # Mapping: VedaLang field -> VEDA column name
-    bound_mapping = {
-        "activity_bound": "act_bnd",
-        "cap_bound": "cap_bnd",
-        "ncap_bound": "ncap_bnd",
-    }
-
-    # Mapping: VedaLang limtype key -> VEDA limtype value
-    limtype_mapping = {
-        "up": "UP",
-        "lo": "LO",
-        "fx": "FX",
-    }
-
-    for vedalang_field, veda_column in bound_mapping.items():
+    for vedalang_field, veda_column in BOUND_COLUMNS.items():
         bound_spec = process.get(vedalang_field)
         if not bound_spec:
             continue
 
         for limit_key, limit_value in bound_spec.items():
-            if limit_key not in limtype_mapping:
+            limtype = LIMTYPES.get(limit_key)
+            if limtype is None:
                 continue
             params.append({
-                "limtype": limtype_mapping[limit_key],
+                "limtype": limtype,
                 veda_column: limit_value,
             })
 
     return params
 
 
-def _commodity_type_to_csets(ctype: str) -> str:
-    """Map VedaLang commodity type to VEDA Csets."""
-    mapping = {
-        "energy": "NRG",
-        "material": "MAT",
-        "emission": "ENV",
-        "demand": "DEM",
-    }
-    return mapping.get(ctype, "NRG")
-
-
 def _get_model_years(model: dict) -> list[int]:
     """
     Derive the list of model representative years from start_year and time_periods.
@@ -759,6 +857,21 @@ def _get_model_years(model: dict) -> list[int]:
     return years
 
 
+@functools.lru_cache(maxsize=256)
+def _year_key_order(keys: tuple) -> tuple[tuple[tuple[int, Any], ...], bool]:
+    """
+    Sort the year keys of a series by integer year.
+
+    Only keys are cached, never values: 1 == 1.0 would otherwise let a
+    cached series hand back values of the wrong type.
+
+    Returns:
+        Tuple of ((year, key) pairs in year order, whether years are unique)
+    """
+    order = tuple(sorted(((int(k), k) for k in keys), key=itemgetter(0)))
+    return order, len({y for y, _ in order}) == len(order)
+
+
 def _expand_series_to_years(
     sparse_values: dict[str, float],
     model_years: list[int],
@@ -784,12 +897,19 @@ def _expand_series_to_years(
     Returns:
         Dictionary of year (as int) -> interpolated value
     """
-    # Convert string keys to int and sort
-    points = sorted([(int(y), v) for y, v in sparse_values.items()])
+    # Convert string keys to int and sort (key order is cached per series)
+    key_order, unique_years = _year_key_order(tuple(sparse_values))
+    points = [(y, sparse_values[k]) for y, k in key_order]
+    if not unique_years:
+        points.sort()  # Break ties between duplicate years by value
 
     if not points:
         return {}
 
+    # A single point under full extrapolation applies to every model year
+    if interpolation == "interp_extrap" and len(points) == 1:
+        return dict.fromkeys(model_years, points[0][1])
+
     result = {}
     first_year, first_val = points[0]
     last_year, last_val = points[-1]
@@ -801,35 +921,47 @@ def _expand_series_to_years(
     )
     do_interpolate = interpolation != "none"
 
+    # Year -> value for exact matches (first point wins on duplicate years)
+    point_values: dict[int, Any] = {}
+    for y, v in points:
+        point_values.setdefault(y, v)
+
+    # If no interpolation, only the specified years are emitted
+    if not do_interpolate:
+        return {
+            ym: v for ym in model_years if (v := point_values.get(ym)) is not None
+        }
+
+    # Sorted point years for binary search of the surrounding points
+    point_years = [y for y, _ in points]
+    n_points = len(points)
+
     for ym in model_years:
         # Check if exact match exists
-        exact = next((v for y, v in points if y == ym), None)
+        exact = point_values.get(ym)
         if exact is not None:
             result[ym] = exact
             continue
 
-        # If no interpolation, skip non-specified years
-        if not do_interpolate:
-            continue
+        # points[:lo] lie before ym and points[hi:] after it
+        lo = hi = bisect_left(point_years, ym)
+        if ym in point_values:
+            hi = bisect_right(point_years, ym, lo)
 
-        # Find surrounding points
-        before = [(y, v) for y, v in points if y < ym]
-        after = [(y, v) for y, v in points if y > ym]
-
-        if not before:
+        if lo == 0:
             # Before first point - backward extrapolation
             if extrap_backward:
                 result[ym] = first_val
             # else: skip this year
-        elif not after:
+        elif hi == n_points:
             # After last point - forward extrapolation
             if extrap_forward:
                 result[ym] = last_val
             # else: skip this year
         else:
             # Between two points - linear interpolation
-            y0, v0 = before[-1]
-            y1, v1 = after[0]
+            y0, v0 = points[lo - 1]
+            y1, v1 = points[hi]
             ratio = (ym - y0) / (y1 - y0)
             result[ym] = v0 + (v1 - v0) * ratio
 
@@ -869,17 +1001,7 @@ def _compile_commodity_price_scenario(
         sparse_values, model_years, interpolation
     )
 
-    rows = []
-    for region in regions:
-        for year, value in sorted(dense_values.items()):
-            rows.append({
-                "region": region,
-                "cset_cn": commodity,
-                "year": year,
-                "com_cstnet": value,
-            })
-
-    return rows
+    return _scenario_rows(commodity, "com_cstnet", dense_values, regions)
 
 
 def _compile_demand_projection_scenario(
@@ -913,17 +1035,41 @@ def _compile_demand_projection_scenario(
         sparse_values, model_years, interpolation
     )
 
-    rows = []
-    for region in regions:
-        for year, value in sorted(dense_values.items()):
-            rows.append({
-                "region": region,
-                "cset_cn": commodity,  # Commodity selector for TFM tables
-                "year": year,
-                "com_proj": value,  # Canonical attribute column
-            })
+    # com_proj is the canonical attribute column
+    return _scenario_rows(commodity, "com_proj", dense_values, regions)
+
+
+def _scenario_rows(
+    commodity: str,
+    column: str,
+    dense_values: dict[int, float],
+    regions: list[str],
+) -> list[dict]:
+    """
+    Emit ~TFM_DINS-AT rows (one per region × year) for a dense time series.
+
+    Args:
+        commodity: Commodity selector for the cset_cn column
+        column: Attribute column header (e.g., com_cstnet, com_proj)
+        dense_values: Year -> value mapping for all emitted years
+        regions: List of model regions (rows emitted for each)
+
+    Returns:
+        List of rows, region-major and in ascending year order
+    """
+    items = sorted(dense_values.items())  # Once, not once per region
+    return [
+        {"region": region, "cset_cn": commodity, "year": year, column: value}
+        for region in regions
+        for year, value in items
+    ]
 
-    return rows
+
+# Scenario type -> compiler returning ~TFM_DINS-AT rows
+_SCENARIO_COMPILERS = {
+    "commodity_price": _compile_commodity_price_scenario,
+    "demand_projection": _compile_demand_projection_scenario,
+}
 
 
 def _compile_trade_links(
@@ -962,17 +1108,14 @@ def _compile_trade_links(
     if not trade_links:
         return [], [], []
 
-    from collections import defaultdict
-
     # Build commodity lookup for unit
     comm_units = {c["name"]: c.get("unit", "PJ") for c in commodities}
 
-    # Group trade links by commodity and bidirectional flag
-    grouped: dict[tuple[str, bool], list[dict]] = defaultdict(list)
+    # Group trade links by (commodity, bidirectional flag), then by origin
+    grouped: dict[tuple[str, bool], dict[str, list[dict]]] = {}
     for link in trade_links:
-        commodity = link["commodity"]
-        bidirectional = link.get("bidirectional", True)
-        grouped[(commodity, bidirectional)].append(link)
+        group_key = (link["commodity"], link.get("bidirectional", True))
+        grouped.setdefault(group_key, {}).setdefault(link["origin"], []).append(link)
 
     # Build sheets for trade links (matrix format)
     tradelink_sheets = []
@@ -980,60 +1123,50 @@ def _compile_trade_links(
     topology_rows = []  # Trade process topology (inputs/outputs) + efficiency
     emitted_processes: set[str] = set()  # Track to avoid duplicates
 
-    for (commodity, bidirectional), links in grouped.items():
+    for (commodity, bidirectional), links_by_origin in grouped.items():
         # Sheet name encodes direction and commodity
         direction = "Bi" if bidirectional else "Uni"
         sheet_name = f"{direction}_{commodity}"
         direction_code = "B" if bidirectional else "U"
+        unit = comm_units.get(commodity, "PJ")
 
-        # Collect all unique regions for matrix
-        all_regions: set[str] = set()
-        for link in links:
-            all_regions.add(link["origin"])
-            all_regions.add(link["destination"])
-
-        # Build matrix rows - one row per origin, columns are destinations
+        # Build matrix rows - one row per origin with outgoing links,
+        # columns are destinations
         rows = []
-        for origin in sorted(all_regions):
-            # Check if this origin has any outgoing links
-            outgoing = [lnk for lnk in links if lnk["origin"] == origin]
-            if not outgoing:
-                continue
+        for origin in sorted(links_by_origin):
+            outgoing = links_by_origin[origin]
 
             row: dict = {commodity: origin}
             for link in outgoing:
                 dest = link["destination"]
                 efficiency = link.get("efficiency")
 
-                # Generate predictable process name
-                process_name = f"T_{direction_code}_{commodity}_{origin}_{dest}_01"
+                # Generate predictable process name (interned: it is repeated
+                # across matrix, declaration and topology rows)
+                process_name = sys.intern(
+                    f"T_{direction_code}_{commodity}_{origin}_{dest}_01"
+                )
 
                 # Cell value: use explicit process name
                 row[dest] = process_name
 
                 # Emit explicit process declaration for ORIGIN region
                 # (IRE processes are declared in the exporting region)
+                # (the set only matters when the source repeats a link)
                 if process_name not in emitted_processes:
-                    unit = comm_units.get(commodity, "PJ")
-                    process_rows.append({
+                    declaration = {
                         "region": origin,
                         "process": process_name,
                         "description": f"Trade {commodity} from {origin} to {dest}",
                         "sets": "IRE",
                         "tact": unit,
                         "tcap": "",  # Trade processes typically don't have capacity
-                    })
+                    }
+                    process_rows.append(declaration)
 
                     # For bidirectional, also declare in destination region
                     if bidirectional:
-                        process_rows.append({
-                            "region": dest,
-                            "process": process_name,
-                            "description": f"Trade {commodity} from {origin} to {dest}",
-                            "sets": "IRE",
-                            "tact": unit,
-                            "tcap": "",
-                        })
+                        process_rows.append(declaration | {"region": dest})
 
                     # Emit topology rows - IRE processes need commodity flows
                     # Origin exports (OUT), destination imports (IN)
@@ -1132,35 +1265,24 @@ def _compile_timeslices(
             )
             raise ValueError("\n".join(msg_parts))
 
-    timeslice_rows = []
-
     # Emit cross-product of level codes
     # xl2times expects level codes and concatenates them to form leaf names
-    import itertools
-
     s_list = season_codes if season_codes else [""]
     w_list = weekly_codes if weekly_codes else [""]
     d_list = daynite_codes if daynite_codes else [""]
 
-    for s, w, d in itertools.product(s_list, w_list, d_list):
-        # Skip if all are empty
-        if not s and not w and not d:
-            continue
-        timeslice_rows.append({
-            "season": s,
-            "weekly": w,
-            "daynite": d,
-        })
+    timeslice_rows = [
+        {"season": s, "weekly": w, "daynite": d}
+        for s, w, d in product(s_list, w_list, d_list)
+        if s or w or d  # Skip if all are empty
+    ]
 
     # Build ~TFM_INS rows for year fractions
-    yrfr_rows = []
-    for ts_name, fraction in fractions.items():
-        # YRFR applies to all regions via allregions column
-        yrfr_rows.append({
-            "timeslice": ts_name,
-            "attribute": "YRFR",
-            "allregions": fraction,
-        })
+    # YRFR applies to all regions via allregions column
+    yrfr_rows = [
+        {"timeslice": ts_name, "attribute": "YRFR", "allregions": fraction}
+        for ts_name, fraction in fractions.items()
+    ]
 
     return timeslice_rows, yrfr_rows
 
@@ -1184,20 +1306,13 @@ def _generate_leaf_timeslices(
     Returns:
         List of leaf timeslice names (e.g., ["SD", "SN", "WD", "WN"])
     """
-    import itertools
-
-    # Use [""] as placeholder for empty levels to ensure product works
-    s_list = seasons if seasons else [""]
-    w_list = weeklies if weeklies else [""]
-    d_list = daynites if daynites else [""]
-
-    leaves = []
-    for s, w, d in itertools.product(s_list, w_list, d_list):
-        leaf = s + w + d
-        if leaf:  # Only add non-empty leaf names
-            leaves.append(leaf)
+    # Extend the prefixes level by level, skipping empty levels entirely
+    leaves = [""]
+    for codes in (seasons, weeklies, daynites):
+        if codes:
+            leaves = [prefix + code for prefix in leaves for code in codes]
 
-    return leaves
+    return [leaf for leaf in leaves if leaf]  # Only non-empty leaf names
 
 
 def _compile_constraints(
@@ -1301,8 +1416,6 @@ def _compile_emission_cap(
     Returns:
         List of ~UC_T rows
     """
-    rows = []
-
     # Get RHS values - either single limit or year-specific
     if "years" in constraint:
         sparse_values = constraint["years"]
@@ -1319,9 +1432,10 @@ def _compile_emission_cap(
 
     # Emit LHS coefficient row: UC_COMPRD for the commodity
     # Use uc_comprd as column header (lowercase for xl2times)
-    description = f"Emission cap on {commodity}"
-    for year in sorted(dense_values.keys()):
-        rows.append({
+    description = sys.intern(f"Emission cap on {commodity}")
+    years = sorted(dense_values)
+    rows = [
+        {
             "uc_n": uc_name,
             "description": description,
             "region": region,
@@ -1329,19 +1443,23 @@ def _compile_emission_cap(
             "commodity": commodity,
             "side": "LHS",
             "uc_comprd": 1,
-        })
+        }
+        for year in years
+    ]
 
     # Use uc_rhsrt (region + year variant) for year-specific RHS values
     # UC_RHSRT indexes: [region, uc_n, year, limtype]
-    for year in sorted(dense_values.keys()):
-        rows.append({
+    rows.extend(
+        {
             "uc_n": uc_name,
             "description": description,
             "region": region,
             "year": year,
             "limtype": limtype,
             "uc_rhsrt": dense_values[year],
-        })
+        }
+        for year in years
+    )
 
     return rows
 
@@ -1445,49 +1563,52 @@ def _compile_share_constraint(
     """
     rows = []
     bound_type = "minimum" if limtype == "LO" else "maximum"
-    description = f"Activity share ({bound_type} {share:.0%}) on {commodity}"
+    # Interned so identical descriptions across constraints share one object
+    description = sys.intern(
+        f"Activity share ({bound_type} {share:.0%}) on {commodity}"
+    )
+
+    # Leading columns shared by every row; each row copies this template and
+    # fills in the remaining columns in order
+    row_head = {"uc_n": uc_name, "description": description, "region": region}
 
     for year in model_years:
         # LHS: Add target process activities with coefficient 1
         # Use uc_act as column header (lowercase for xl2times)
         for process in processes:
-            rows.append({
-                "uc_n": uc_name,
-                "description": description,
-                "region": region,
-                "year": year,
-                "process": process,
-                "side": "LHS",
-                "uc_act": 1,
-            })
+            row = row_head.copy()
+            row["year"] = year
+            row["process"] = process
+            row["side"] = "LHS"
+            row["uc_act"] = 1
+            rows.append(row)
 
         # LHS: Subtract share * commodity production
         # Use uc_comprd as column header (lowercase for xl2times)
-        rows.append({
-            "uc_n": uc_name,
-            "description": description,
-            "region": region,
-            "year": year,
-            "commodity": commodity,
-            "side": "LHS",
-            "uc_comprd": -share,
-        })
+        row = row_head.copy()
+        row["year"] = year
+        row["commodity"] = commodity
+        row["side"] = "LHS"
+        row["uc_comprd"] = -share
+        rows.append(row)
 
         # RHS: The bound is 0
         # Use uc_rhsrt (region + year variant) since we have year-specific constraints
-        rows.append({
-            "uc_n": uc_name,
-            "description": description,
-            "region": region,
-            "year": year,
-            "limtype": limtype,
-            "uc_rhsrt": 0,
-        })
+        row = row_head.copy()
+        row["year"] = year
+        row["limtype"] = limtype
+        row["uc_rhsrt"] = 0
+        rows.append(row)
 
     return rows
 
 
 def load_vedalang(path: Path) -> dict:
-    """Load VedaLang source from YAML file."""
-    with open(path) as f:
-        return yaml.safe_load(f)
+    """Load VedaLang source from a YAML file (or a .json file, parsed as JSON)."""
+    path = Path(path)
+    if path.suffix == ".json":
+        return json.loads(path.read_bytes())
+    # Binary mode: the YAML reader detects the encoding itself (UTF-8/16 per
+    # the YAML spec) instead of decoding with the locale's codec
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=YAML_LOADER)